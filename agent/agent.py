@@ -1,11 +1,16 @@
 from __future__ import annotations
+import asyncio
 from typing import AsyncGenerator, Awaitable, Callable
 from agent.events import AgentEvent, AgentEventType
 from agent.session import Session
-from client.response import StreamEventType, TokenUsage, ToolCall, ToolResultMessage, parse_tool_call_arguments
+from client.response import StreamEventType, TokenUsage, ToolCall, ToolResultMessage
 from config.config import Config
+from context.manager import NOT_PROCESSED_OUTPUT
 from prompts.system import create_loop_breaker_prompt
-from tools.base import ToolConfirmation
+from tools.base import ToolConfirmation, ToolResult
+
+# Model output for the fixed error result, built once instead of per call
+MISSING_NAME_OUTPUT = ToolResult.error_result(error="Tool call missing name").to_model_output()
 
 
 class Agent:
@@ -32,10 +37,16 @@ class Agent:
                 final_response = event.data.get("content")
 
         await self.session.hook_system.trigger_after_agent(message, final_response)
-        yield AgentEvent.agent_end(final_response)
+        yield AgentEvent.agent_end(
+            final_response,
+            self.session.context_manager.total_usage,
+        )
 
     async def _agentic_loop(self) -> AsyncGenerator[AgentEvent, None]:
         max_turns = self.config.max_turns
+        tool_schemas = self.session.tool_registry.get_schemas()
+        # System prompt and tool schemas form the persistent prefix of every request
+        system_prompt = self.session.context_manager.system_prompt
 
         for turn_num in range(max_turns):
             self.session.increment_turn()
@@ -52,14 +63,13 @@ class Agent:
                     self.session.context_manager.set_latest_usage(usage)
                     self.session.context_manager.add_usage(usage)
 
-            tool_schemas = self.session.tool_registry.get_schemas()
-
             tool_calls: list[ToolCall] = []
             usage: TokenUsage | None = None
 
             async for event in self.session.client.chat_completion(
-                self.session.context_manager.get_messages(),
+                self.session.context_manager.get_messages(include_system=False),
                 tools=tool_schemas if tool_schemas else None,
+                system_prompt=system_prompt,
             ):
                 if event.type == StreamEventType.TEXT_DELTA:
                     if event.text_delta:
@@ -86,21 +96,7 @@ class Agent:
             
             self.session.context_manager.add_assistant_message(
                 response_text or None,
-                (
-                    [
-                        {
-                            "id": tc.call_id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": str(tc.arguments),
-                            },
-                        }
-                        for tc in tool_calls
-                    ]
-                    if tool_calls
-                    else None
-                ),
+                tool_calls or None,
             )
             if response_text:
                 yield AgentEvent.text_complete(response_text)
@@ -114,35 +110,31 @@ class Agent:
                     self.session.context_manager.set_latest_usage(usage)
                     self.session.context_manager.add_usage(usage)
 
-                self.session.context_manager.prune_tool_outputs()
+                if self.session.context_manager.needs_pruning():
+                    self.session.context_manager.prune_tool_outputs()
                 return
 
             tool_call_results: list[ToolResultMessage] = []
             # Track all tool_call_ids that were added to assistant message
             assistant_tool_call_ids = {tc.call_id for tc in tool_calls}
+            # Filled in as each tool call gets a result (happy and error paths)
+            processed_ids: set[str] = set()
 
             for tool_call in tool_calls:
                 if not tool_call.name:
                     # Tool call without name - add error result to ensure API protocol is satisfied
-                    from tools.base import ToolResult
-                    error_result = ToolResult.error_result(
-                        error="Tool call missing name",
-                        output="",
-                    )
                     tool_call_results.append(
                         ToolResultMessage(
                             tool_call_id=tool_call.call_id,
-                            content=error_result.to_model_output(),
+                            content=MISSING_NAME_OUTPUT,
                             is_error=True,
                         )
                     )
+                    processed_ids.add(tool_call.call_id)
                     continue
                 
-                # Parse arguments from string to dict
-                if isinstance(tool_call.arguments, str):
-                    parsed_args = parse_tool_call_arguments(tool_call.arguments)
-                else:
-                    parsed_args = tool_call.arguments or {}
+                # Parse arguments from string to dict (cached on the tool call)
+                parsed_args = tool_call.parsed_arguments()
                 
                 yield AgentEvent.tool_call_start(
                     tool_call.call_id,
@@ -166,7 +158,6 @@ class Agent:
                     )
                 except Exception as e:
                     # If tool execution fails, add error result to ensure API protocol is satisfied
-                    from tools.base import ToolResult
                     result = ToolResult.error_result(
                         error=f"Tool execution failed: {str(e)}",
                         output="",
@@ -185,33 +176,27 @@ class Agent:
                         is_error=not result.success,
                     )
                 )
+                processed_ids.add(tool_call.call_id)
+
+            results_to_add = [
+                (tool_result.tool_call_id, tool_result.content)
+                for tool_result in tool_call_results
+            ]
 
-            # Add all tool results to context, inserting them immediately after the assistant message
-            # This ensures the API protocol is satisfied: tool results must immediately follow assistant messages with tool_calls
-            for tool_result in tool_call_results:
-                self.session.context_manager.add_tool_result(
-                    tool_result.tool_call_id,
-                    tool_result.content,
-                    insert_after_assistant_index=assistant_message_index,
-                )
-            
             # CRITICAL: Validate that every tool_call_id in assistant message has a result
             # This ensures the API protocol is always satisfied
-            tool_result_ids = {tr.tool_call_id for tr in tool_call_results}
-            missing_ids = assistant_tool_call_ids - tool_result_ids
+            missing_ids = assistant_tool_call_ids - processed_ids
             if missing_ids:
-                # Defensively add error results for any missing IDs, also inserting after assistant message
-                from tools.base import ToolResult
+                # Defensively add error results for any missing IDs
                 for missing_id in missing_ids:
-                    error_result = ToolResult.error_result(
-                        error="Tool call was not processed",
-                        output="",
-                    )
-                    self.session.context_manager.add_tool_result(
-                        missing_id,
-                        error_result.to_model_output(),
-                        insert_after_assistant_index=assistant_message_index,
-                    )
+                    results_to_add.append((missing_id, NOT_PROCESSED_OUTPUT))
+
+            # Add all tool results to context, inserting them immediately after the assistant message
+            # This ensures the API protocol is satisfied: tool results must immediately follow assistant messages with tool_calls
+            self.session.context_manager.add_tool_results(
+                results_to_add,
+                insert_after_assistant_index=assistant_message_index,
+            )
 
             loop_detection_error = self.session.loop_detector.check_for_loop()
             if loop_detection_error:
@@ -222,9 +207,29 @@ class Agent:
                 self.session.context_manager.set_latest_usage(usage)
                 self.session.context_manager.add_usage(usage)
 
-            self.session.context_manager.prune_tool_outputs()
+            if self.session.context_manager.needs_pruning():
+                self.session.context_manager.prune_tool_outputs()
         yield AgentEvent.agent_error(f"Maximum turns ({max_turns}) reached")
 
+    async def run_once(self, message: str) -> AsyncGenerator[AgentEvent, None]:
+        # Single-shot run without the context manager protocol: initialize,
+        # stream the events for one message, then shut the session down
+        await self.session.initialize()
+        try:
+            async for event in self.run(message):
+                yield event
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self.session and self.session.client and self.session.mcp_manager:
+            # LLM client and MCP servers are independent, shut them down together
+            await asyncio.gather(
+                self.session.client.close(),
+                self.session.mcp_manager.shutdown(),
+            )
+            self.session = None
+
     async def __aenter__(self) -> Agent:
         await self.session.initialize()
         return self
@@ -235,7 +240,4 @@ class Agent:
         exc_val,
         exc_tb,
     ) -> None:
-        if self.session and self.session.client and self.session.mcp_manager:
-            await self.session.client.close()
-            await self.session.mcp_manager.shutdown()
-            self.session = None
+        await self.close()
@@ -22,7 +22,7 @@ class AgentEventType(str, Enum):
     TEXT_COMPLETE = "text_complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     type: AgentEventType
     data: dict[str, Any] = field(default_factory=dict)
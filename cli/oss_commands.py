@@ -5,10 +5,17 @@ Click command group for OSS-specific commands.
 """
 
 import asyncio
+import atexit
+import io
+import os
+import re
 import subprocess
+import sys
 import logging
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import click
 from rich.console import Console
@@ -22,12 +29,87 @@ from rich.spinner import Spinner
 from rich.live import Live
 from rich.status import Status
 
+# Agent, event and config modules pull in pydantic, tool schemas and the LLM
+# client; they are imported where used so read-only commands start fast
+if TYPE_CHECKING:
+    from agent.agent import Agent
+    from agent.events import AgentEvent
+    from config.config import Config
+    from oss.workflow import OSSWorkflow, WorkflowState
+
 console = Console()
 logger = logging.getLogger(__name__)
 
+# user_confirm output: "CONFIRMATION_REQUIRED: <message>" then "Default: yes|no"
+_CONFIRM_RE = re.compile(
+    r"^CONFIRMATION_REQUIRED:[ \t]*(?P<message>[^\n]*?)[ \t]*$(?:.*?^[^\n]*Default:(?P<default>[^\n]*))?",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Uncommitted changes listed by oss-dev status before the rest are summarized
+_MAX_STATUS_ENTRIES = 50
+
+# Appended to oss_fix's initial message so the agent advances the workflow itself
+_PHASE_COMPLETION_GUIDE = """## IMPORTANT: Phase Completion
+After completing each phase, you MUST call the 'workflow_orchestrator' tool with action 'mark_phase_complete' to transition to the next phase.
+
+Example:
+- After completing planning: workflow_orchestrator(action='mark_phase_complete')
+- After completing implementation: workflow_orchestrator(action='mark_phase_complete')
+- After completing verification: workflow_orchestrator(action='mark_phase_complete')
+- And so on for each phase...
+
+The workflow will automatically transition to the next phase when you mark the current one complete.
+
+Use 'workflow_orchestrator' tool with action 'get_status' to check current workflow state at any time."""
+
+# Injected after each phase transition in oss_fix so the agent keeps going
+_PHASE_CONTINUE_MESSAGE = """✅ Phase transition complete! 
+
+🔄 **NEW PHASE: {phase}**
+
+{phase_prompt}
+
+**IMPORTANT:** You MUST continue working on this phase. This is NOT the end of the workflow. Complete all required tasks for this phase, then call 'workflow_orchestrator(action='mark_phase_complete')' to proceed to the next phase.
+
+The workflow has {remaining} phases remaining. Keep working!"""
+
+# Tools whose calls oss_fix always shows, and the workflow phases in order
+_IMPORTANT_TOOLS = frozenset({"git_branch", "git_commit", "git_push", "create_pr", "create_start_here"})
+_WORKFLOW_PHASES = (
+    "repository_understanding",
+    "issue_intake",
+    "planning",
+    "implementation",
+    "verification",
+    "validation",
+    "commit_and_pr",
+)
+# Built once: looked up on every phase transition
+_PHASES_REMAINING = {
+    phase: len(_WORKFLOW_PHASES) - index for index, phase in enumerate(_WORKFLOW_PHASES)
+}
+_PHASE_DISPLAY = {phase: phase.replace("_", " ").title() for phase in _WORKFLOW_PHASES}
+
+# Initialized agents keyed by id(config), reused across runs in the same process
+_AGENT_POOL: dict[int, "Agent"] = {}
+
+
+def _phase_display(phase: str) -> str:
+    """Title-cased phase name, e.g. "Commit And Pr" for "commit_and_pr"."""
+    return _PHASE_DISPLAY.get(phase) or phase.replace("_", " ").title()
+
+
+def validate_oss_enabled(config, ctx: Optional[click.Context] = None) -> bool:
+    """
+    Check if OSS is enabled in config.
+
+    When a Click context is given, a successful check is remembered in
+    ctx.obj alongside the loaded config, so it only runs once per invocation.
+    """
+    if ctx is not None and ctx.obj.get("oss_enabled"):
+        return True
 
-def validate_oss_enabled(config) -> bool:
-    """Check if OSS is enabled in config."""
     if not config.oss.enabled:
         console.print(
             "[error]OSS Dev Agent is not enabled.[/error]\n"
@@ -43,6 +125,8 @@ def validate_oss_enabled(config) -> bool:
         )
         return False
     
+    if ctx is not None:
+        ctx.obj["oss_enabled"] = True
     return True
 
 
@@ -50,57 +134,671 @@ def get_repo_from_cwd(cwd: Path) -> Optional[tuple[str, str]]:
     """
     Get repository owner and name from current directory.
 
+    Results are cached per resolved directory (see oss.git_client.get_github_repo).
+
     Returns:
         Tuple of (owner, repo) or None
     """
+    from oss.git_client import get_github_repo
+
+    return get_github_repo(cwd)
+
+
+@dataclass
+class RepoState:
+    """Branch and working tree state from a single `git status` call."""
+
+    current_branch: Optional[str] = None
+    upstream: Optional[str] = None
+    uncommitted: list[str] = field(default_factory=list)
+
+
+_REPO_STATE_ARGS = ["status", "--porcelain=v2", "--branch", "-z"]
+_GIT_STATUS_TIMEOUT = 30
+
+
+def _start_repo_state(cwd: Path, untracked: bool = True) -> Optional[subprocess.Popen]:
+    """
+    Start the `git status` call behind _collect_repo_state in the background.
+
+    With untracked=False git skips its untracked-file walk, usually the
+    slowest part of status in workspaces with large ignored-but-unlisted trees.
+    """
+    from oss.git_client import start_git
+
+    args = _REPO_STATE_ARGS if untracked else [*_REPO_STATE_ARGS, "--untracked-files=no"]
+    return start_git(args, cwd)
+
+
+def _collect_repo_state(
+    cwd: Path, proc: Optional[subprocess.Popen] = None
+) -> Optional[RepoState]:
+    """
+    Read branch, upstream and uncommitted changes with one git invocation.
+
+    Args:
+        cwd: Repository directory
+        proc: Process from _start_repo_state, if one was already started
+
+    Returns:
+        RepoState, or None if cwd is not a git repository
+    """
+    if proc is None:
+        proc = _start_repo_state(cwd)
+        if proc is None:
+            return None
+
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        url = result.stdout.strip()
-        if "github.com" in url:
-            parts = url.replace(".git", "").split("github.com/")[-1].split("/")
-            if len(parts) >= 2:
-                return parts[0], parts[1]
-    except Exception:
-        pass
-    return None
+        stdout, _ = proc.communicate(timeout=_GIT_STATUS_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return None
+    if proc.returncode != 0:
+        return None
+    output = stdout.decode("utf-8", "replace")
+
+    state = RepoState()
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if entry.startswith("# branch.head "):
+            head = entry[len("# branch.head "):]
+            # Match `git rev-parse --abbrev-ref HEAD` for a detached HEAD
+            state.current_branch = "HEAD" if head == "(detached)" else head
+        elif entry.startswith("# branch.upstream "):
+            state.upstream = entry[len("# branch.upstream "):]
+        elif entry.startswith("1 "):
+            _, xy, rest = entry.split(" ", 2)
+            state.uncommitted.append(f"{xy.replace('.', ' ')} {rest.split(' ', 6)[-1]}")
+        elif entry.startswith("2 "):
+            # Renames/copies: the original path follows as its own NUL-separated entry
+            _, xy, rest = entry.split(" ", 2)
+            original = next(entries, "")
+            state.uncommitted.append(
+                f"{xy.replace('.', ' ')} {original} -> {rest.split(' ', 7)[-1]}"
+            )
+        elif entry.startswith("u "):
+            _, xy, rest = entry.split(" ", 2)
+            state.uncommitted.append(f"{xy} {rest.split(' ', 8)[-1]}")
+        elif entry.startswith(("? ", "! ")):
+            state.uncommitted.append(f"{entry[0] * 2} {entry[2:]}")
+
+    return state
+
+
+async def get_or_create_agent(config) -> "Agent":
+    """
+    Get an initialized Agent for a config, creating it on first use.
+
+    Session setup (LLM client, MCP handshake, tool discovery) runs once per
+    config; a reused agent starts with a cleared conversation.
+
+    Returns:
+        Initialized Agent
+    """
+    from agent.agent import Agent
+
+    agent = _AGENT_POOL.get(id(config))
+    if agent is not None and agent.session is not None:
+        agent.session.context_manager.clear()
+        agent.session.loop_detector.clear()
+        return agent
+
+    agent = Agent(config)
+    try:
+        await agent.__aenter__()
+    except BaseException:
+        # A failed or cancelled setup must not leave MCP servers running; the
+        # agent only enters the pool once fully initialized
+        await agent.close()
+        raise
+    _AGENT_POOL[id(config)] = agent
+    return agent
+
+
+async def _start_workflow_with_agent(
+    config, workflow: "OSSWorkflow", issue_url: str
+) -> tuple["Agent", "WorkflowState"]:
+    """
+    Start a workflow while the agent is set up concurrently.
+
+    Agent setup (LLM client, MCP connections) runs while the workflow does its
+    git checks and fetches the issue. If the workflow fails, the agent setup
+    is cancelled and awaited before the error propagates.
+
+    Returns:
+        Tuple of (agent, workflow state)
+
+    Raises:
+        ValueError: issue_url is not a GitHub issue URL (checked before any setup starts)
+    """
+    workflow.github_client.parse_issue_url(issue_url)
+
+    agent_task = asyncio.create_task(get_or_create_agent(config))
+    try:
+        state = await workflow.start(issue_url)
+    except BaseException:
+        agent_task.cancel()
+        await asyncio.gather(agent_task, return_exceptions=True)
+        raise
+    return await agent_task, state
+
+
+async def shutdown_agents() -> None:
+    """Close all pooled agents (LLM client and MCP servers)."""
+    while _AGENT_POOL:
+        _, agent = _AGENT_POOL.popitem()
+        try:
+            await agent.close()
+        except Exception as e:
+            logger.debug(f"Error shutting down agent: {e}")
+
+
+def _get_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Pick the event loop implementation for the shared runner.
+
+    On Windows, winloop is used when installed. Otherwise the Proactor loop is
+    kept: the selector loop can't run the subprocesses the shell tool and
+    hooks spawn.
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        import winloop
+    except ModuleNotFoundError:
+        return asyncio.ProactorEventLoop
+    return winloop.new_event_loop
+
+
+# Set OSS_DEV_ASYNCIO_DEBUG=1 to run the shared loop in asyncio debug mode and
+# log loop steps or event renders that block for longer than this many seconds
+_SLOW_CALLBACK_SECONDS = 0.05
+
+# Shared event loop for all commands run in this process (see run_async)
+_RUNNER: Optional[asyncio.Runner] = None
+
+
+def run_async(coro):
+    """
+    Run a coroutine on the shared event loop, creating it on first use.
+
+    Reusing one loop lets pooled agents (and their HTTP clients and MCP
+    connections) survive across commands; they are shut down at exit.
+    """
+    global _RUNNER
+    if _RUNNER is None:
+        debug = bool(os.environ.get("OSS_DEV_ASYNCIO_DEBUG"))
+        _RUNNER = asyncio.Runner(debug=debug, loop_factory=_get_loop_factory())
+        if debug:
+            _RUNNER.get_loop().slow_callback_duration = _SLOW_CALLBACK_SECONDS
+        atexit.register(_close_runner)
+    return _RUNNER.run(coro)
+
+
+def _close_runner() -> None:
+    global _RUNNER
+    if _RUNNER is None:
+        return
+    try:
+        _RUNNER.run(shutdown_agents())
+        github = sys.modules.get("oss.github")
+        if github is not None:
+            _RUNNER.run(github.close_http_client())
+    finally:
+        _RUNNER.close()
+        _RUNNER = None
+
+
+class StreamingPrinter:
+    """
+    Buffers agent output and writes it to the console in batches.
+
+    Streamed text deltas and status lines (tool calls, errors) are queued in
+    order and written every FLUSH_INTERVAL seconds or once MAX_BUFFER
+    characters of text accumulate, so a burst of events costs one console
+    write instead of one per event. When the console isn't a terminal (CI
+    logs, output piped to a file), batches are written as plain text without
+    going through Rich's renderer.
+    """
+
+    FLUSH_INTERVAL = 0.05
+    MAX_BUFFER = 4096
+
+    def __init__(self, output: Console):
+        self._output = output
+        # Checked once: styling is dropped off-terminal anyway
+        self._plain = not output.is_terminal
+        self._buffer = io.StringIO()
+        # Status lines waiting to be printed, each after the text that preceded it
+        self._lines: list[tuple[str, "str | Text"]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def write(self, text: str) -> None:
+        """Queue raw text for output."""
+        self._buffer.write(text)
+        if self._buffer.tell() >= self.MAX_BUFFER:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def print(self, line: "str | Text") -> None:
+        """Queue a line (console markup or a styled Text) for output."""
+        self._lines.append((self._buffer.getvalue(), line))
+        self._buffer = io.StringIO()
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.FLUSH_INTERVAL, self.flush
+            )
+
+    def flush(self) -> None:
+        """Write any buffered output immediately."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        text = self._buffer.getvalue()
+        if not text and not self._lines:
+            return
+
+        if self._plain:
+            self._write_plain(text)
+        else:
+            # Entering the console buffers everything printed inside into one write
+            with self._output:
+                for preceding_text, line in self._lines:
+                    if preceding_text:
+                        self._output.out(preceding_text, end="", highlight=False)
+                    self._output.print(line)
+                if text:
+                    # Raw model output: skip markup parsing and highlighting
+                    self._output.out(text, end="", highlight=False)
+        self._lines.clear()
+        self._buffer = io.StringIO()
+
+    def _write_plain(self, text: str) -> None:
+        parts: list[str] = []
+        for preceding_text, line in self._lines:
+            parts.append(preceding_text)
+            if isinstance(line, str):
+                line = Text.from_markup(line)
+            parts.append(line.plain)
+            parts.append("\n")
+        parts.append(text)
+        file = self._output.file
+        file.write("".join(parts))
+        file.flush()
+
+
+# Status lines are built as styled Text rather than markup strings: nothing to
+# parse when printed, and tool names or error messages containing "[...]"
+# aren't mistaken for markup
+_TOOL_COMPLETE_LINE = Text("Tool complete", style="dim")
+# Title of oss_fix's welcome panel (Panel copies its title when rendering)
+_FIX_WELCOME_TITLE = Text.assemble(
+    ("🚀 ", "cyan"),
+    ("OSS Dev Agent", "bold cyan"),
+    (" - Starting workflow", "cyan"),
+)
+
+
+def _on_text_complete(data: dict, printer: StreamingPrinter) -> None:
+    printer.print(data.get("content", ""))
+
+
+def _on_tool_call_start(data: dict, printer: StreamingPrinter) -> None:
+    printer.print(Text(f"\n🔧 Using tool: {data['name'] or 'unknown'}", style="dim"))
+
+
+def _on_tool_call_complete(data: dict, printer: StreamingPrinter) -> None:
+    printer.print(_TOOL_COMPLETE_LINE)
+
+
+def _on_agent_error(data: dict, printer: StreamingPrinter) -> None:
+    printer.print(Text(f"\n{data['error'] or 'Unknown error'}", style="error"))
+
+
+def _on_agent_end(data: dict, printer: StreamingPrinter) -> None:
+    printer.flush()
+    print_usage_summary(data.get("usage"))
+
+
+# Renderers for non-streaming events; TEXT_DELTA goes straight to the printer.
+# Keyed by AgentEventType values (a str enum, so members hash like their value)
+# to avoid importing agent.events at module load.
+_EVENT_HANDLERS: dict[str, Callable[[dict, StreamingPrinter], None]] = {
+    "text_complete": _on_text_complete,
+    "tool_call_start": _on_tool_call_start,
+    "tool_call_complete": _on_tool_call_complete,
+    "agent_error": _on_agent_error,
+    "agent_end": _on_agent_end,
+}
+
+
+def render_agent_event(event: "AgentEvent", printer: StreamingPrinter) -> None:
+    """Render a single agent event for the review/resume/switch commands."""
+    if event.type == "text_delta":
+        # text_delta events always carry "content"
+        printer.write(event.data["content"])
+        return
+
+    handler = _EVENT_HANDLERS.get(event.type)
+    if handler is not None:
+        handler(event.data, printer)
+
+
+async def _stream_agent_run(agent: "Agent", initial_message: str, output: Console) -> None:
+    """Run the agent on a message and render its events as they arrive."""
+    printer = StreamingPrinter(output)
+    # Only time renders in asyncio debug mode, so normal runs pay nothing for it
+    timed = asyncio.get_running_loop().get_debug()
+    try:
+        async for event in agent.run(initial_message):
+            if not timed:
+                render_agent_event(event, printer)
+                continue
+            started = time.perf_counter()
+            render_agent_event(event, printer)
+            elapsed = time.perf_counter() - started
+            if elapsed > _SLOW_CALLBACK_SECONDS:
+                logger.warning(f"Rendering {event.type} event took {elapsed:.3f}s")
+    finally:
+        printer.flush()
+
+
+class FixEventRenderer:
+    """
+    Renders agent events for oss_fix and reacts to workflow tool results.
+
+    Unlike render_agent_event, streamed text is not printed, and tool
+    results drive the workflow: user_confirm requests are answered
+    interactively and phase transitions inject the next phase prompt.
+    Status lines are queued on a StreamingPrinter; it is flushed before
+    panels and prompts so they appear in order.
+    """
+
+    def __init__(
+        self,
+        agent: "Agent",
+        workflow,
+        current_phase_display: str,
+        printer: StreamingPrinter,
+    ) -> None:
+        self.agent = agent
+        self.workflow = workflow
+        self.current_phase_display = current_phase_display
+        self.printer = printer
+        self.last_tool_name: Optional[str] = None
+        self.tool_call_count = 0
+        # Checked once: events arrive per token and per tool call, so don't
+        # format their log lines unless debug logging is actually on
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+        # Keyed by AgentEventType values, like _EVENT_HANDLERS; tool_call_complete
+        # is async and dispatched by handle() itself
+        self._handlers: dict[str, Callable[[dict], None]] = {
+            "text_delta": self._on_text_delta,
+            "text_complete": self._on_text_complete,
+            "tool_call_start": self._on_tool_call_start,
+            "agent_error": self._on_agent_error,
+            "agent_end": self._on_agent_end,
+        }
+
+    async def handle(self, event: "AgentEvent") -> None:
+        # Tool results may prompt the user, which is awaited off the loop
+        if event.type == "tool_call_complete":
+            await self._on_tool_call_complete(event.data)
+            return
+        handler = self._handlers.get(event.type)
+        if handler is not None:
+            handler(event.data)
+
+    def _on_text_delta(self, data: dict) -> None:
+        # Suppress verbose LLM output - only log to debug
+        if self._debug:
+            logger.debug(f"LLM text delta: {data.get('content', '')[:50]}...")
+
+    def _on_text_complete(self, data: dict) -> None:
+        # Suppress verbose LLM output
+        logger.debug("LLM text complete")
+
+    def _on_tool_call_start(self, data: dict) -> None:
+        tool_name = data["name"] or "unknown"
+        tool_args = data.get("arguments", {})
+
+        # Log tool call
+        if self._debug:
+            logger.debug(f"Tool call started: {tool_name} with args: {tool_args}")
+
+        # Special handling for workflow_orchestrator to show phase transitions
+        if tool_name == "workflow_orchestrator":
+            action = tool_args.get("action", "unknown") if isinstance(tool_args, dict) else "unknown"
+            if action == "mark_phase_complete":
+                # Show phase completion
+                self.printer.print(f"\n[green]✓[/green] [bold]Phase Complete:[/bold] {self.current_phase_display}")
+            elif action == "get_status":
+                # Silent - just checking status
+                pass
+            else:
+                logger.info(f"Workflow orchestrator called: action={action}")
+        else:
+            # Only show tool name if it's different from last one (avoid spam)
+            if tool_name != self.last_tool_name:
+                self.tool_call_count += 1
+                # Show tool name but keep it minimal
+                if self.tool_call_count <= 3 or tool_name in _IMPORTANT_TOOLS:
+                    self.printer.print(f"[dim]→ {tool_name}[/dim]")
+                self.last_tool_name = tool_name
+
+    async def _on_tool_call_complete(self, data: dict) -> None:
+        tool_name = data["name"] or "unknown"
+        result = data.get("output", "")
+        success = data.get("success", False)
+
+        # Log tool completion
+        if self._debug:
+            logger.debug(f"Tool call completed: {tool_name}, success={success}")
+
+        # Reset last tool name for next iteration
+        if tool_name == self.last_tool_name:
+            self.last_tool_name = None
+
+        # Handle user confirmation requests
+        if tool_name == "user_confirm" and "CONFIRMATION_REQUIRED" in result:
+            # Extract confirmation message and default in one scan
+            match = _CONFIRM_RE.search(result)
+            confirm_msg = match["message"] if match else ""
+            default_yes = True
+            if match and match["default"] is not None:
+                default_yes = "yes" in match["default"].lower()
+
+            # Ask user for confirmation with beautiful formatting
+            self.printer.flush()
+            confirm_panel = Panel(
+                Text(confirm_msg, style="yellow"),
+                title="[bold yellow]❓ Confirmation Required[/bold yellow]",
+                border_style="yellow",
+                box=box.ROUNDED,
+                padding=(1, 2),
+            )
+            console.print()
+            console.print(confirm_panel)
+            console.print()
+
+            # Blocking stdin read: run it in a thread so the loop keeps serving
+            # the agent's connections. click.confirm doesn't render markup
+            response = await asyncio.to_thread(click.confirm, "Proceed?", default=default_yes)
+
+            if response:
+                success_panel = Panel(
+                    Text("User confirmed. Proceeding with push and PR creation...", style="green"),
+                    border_style="green",
+                    box=box.ROUNDED,
+                    padding=(1, 2),
+                )
+                console.print()
+                console.print(success_panel)
+                console.print()
+
+                # Inject confirmation result back to agent
+                # NOTE: add_tool_result is NOT async, so no await needed
+                if self.agent and self.agent.session and self.agent.session.context_manager:
+                    self.agent.session.context_manager.add_tool_result(
+                        data.get("call_id", ""),
+                        "User confirmed: YES. Proceed with push and PR creation."
+                    )
+            else:
+                branch_name = self.workflow.state.branch_name or "your-branch"
+                decline_content = Text()
+                decline_content.append("User declined. Skipping push and PR creation.\n\n", style="yellow")
+                decline_content.append("To push manually:\n", style="dim")
+                decline_content.append(f"  git push -u origin {branch_name}", style="cyan")
+
+                decline_panel = Panel(
+                    decline_content,
+                    title="[bold yellow]✗ Action Declined[/bold yellow]",
+                    border_style="yellow",
+                    box=box.ROUNDED,
+                    padding=(1, 2),
+                )
+                console.print()
+                console.print(decline_panel)
+                console.print()
+
+                # Inject decline result back to agent
+                # NOTE: add_tool_result is NOT async, so no await needed
+                if self.agent and self.agent.session and self.agent.session.context_manager:
+                    self.agent.session.context_manager.add_tool_result(
+                        data.get("call_id", ""),
+                        "User declined: NO. Skip push and PR creation. Show manual instructions instead."
+                    )
+            return
+
+        # Show phase transitions prominently with beautiful formatting
+        if tool_name == "workflow_orchestrator" and success:
+            # One scan finds the marker and splits off the rest of the result
+            _, transitioned, tail = result.partition("Transitioned to:")
+            # A "marked complete" result without a transition line has no new
+            # phase to show, so only the marker matters
+            if transitioned:
+                # Extract new phase
+                new_phase = tail.split("\n", 1)[0].strip()
+                if new_phase:
+                    self.current_phase_display = _phase_display(new_phase)
+                    # Show new phase
+                    self.printer.print(f"\n[bold cyan]→ Next Phase: {self.current_phase_display}[/bold cyan]\n")
+                    logger.info(f"Phase transition: {new_phase}")
+                    # Reset tool call counter for new phase
+                    self.tool_call_count = 0
+                    self.last_tool_name = None
+
+                    # Get updated phase prompt and inject it as a new message to continue
+                    # CRITICAL: This ensures agent continues working after phase transition
+                    try:
+                        new_phase_prompt = self.workflow.get_phase_prompt()
+                        continue_message = _PHASE_CONTINUE_MESSAGE.format(
+                            phase=new_phase.replace("_", " ").upper(),
+                            phase_prompt=new_phase_prompt,
+                            remaining=_PHASES_REMAINING[new_phase],
+                        )
+                        # Inject message to continue workflow - agent's next turn will pick this up
+                        # NOTE: add_user_message is NOT async, so no await needed
+                        if self.agent and self.agent.session and self.agent.session.context_manager:
+                            self.agent.session.context_manager.add_user_message(continue_message)
+                            logger.info(f"✅ Injected continue message for phase: {new_phase}")
+                        else:
+                            logger.warning("Agent session not available for message injection")
+                        # Show user that agent will continue
+                        self.printer.print(f"[dim]→ Agent will continue with {self.current_phase_display}...[/dim]")
+                    except Exception as e:
+                        logger.error(f"❌ Could not inject continue message: {e}")
+                        self.printer.print("[error]Warning: Could not inject continue message. Agent may stop.[/error]")
+        else:
+            # Show completion only for important operations
+            # Avoid duplicate messages by checking if we already showed this tool
+            if tool_name in _IMPORTANT_TOOLS:
+                if success:
+                    # Only show once per unique tool call to avoid spam
+                    if tool_name != self.last_tool_name:
+                        self.printer.print(f"[green]✓[/green] [dim]{tool_name}[/dim]")
+                else:
+                    # Always show failures
+                    self.printer.print(f"[red]✗[/red] [dim]{tool_name} failed[/dim]")
+
+    def _on_agent_error(self, data: dict) -> None:
+        self.printer.print(f"\n[error]{data['error'] or 'Unknown error'}[/error]")
+
+    def _on_agent_end(self, data: dict) -> None:
+        self.printer.flush()
+        print_usage_summary(data.get("usage"))
+
+
+def print_usage_summary(usage: Optional[dict]) -> None:
+    """Print token usage and prompt-cache hit rate for a finished agent run."""
+    if not usage or not usage.get("prompt_tokens"):
+        return
+
+    prompt_tokens = usage["prompt_tokens"]
+    cached_tokens = usage.get("cached_tokens", 0)
+    hit_rate = cached_tokens / prompt_tokens * 100
+    console.print(
+        f"[dim]Tokens: {prompt_tokens} prompt, {usage.get('completion_tokens', 0)} completion "
+        f"({cached_tokens} cached, {hit_rate:.0f}% cache hit rate)[/dim]"
+    )
 
 
 @click.group(name="oss-dev", help="OSS Dev Agent - Work on GitHub issues")
 @click.option(
     "--cwd",
     "-c",
-    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    type=click.Path(exists=True, file_okay=False, resolve_path=True, path_type=Path),
     help="Working directory (default: current directory)",
 )
 @click.pass_context
 def oss_dev_group(ctx: click.Context, cwd: Optional[Path]):
     """OSS Dev Agent command group."""
     ctx.ensure_object(dict)
-    
-    # Import here to avoid circular imports
-    from config.config import Config
+    # Config is loaded by the subcommand that needs it (see get_command_config),
+    # so --help and argument errors don't depend on a valid configuration
+    ctx.obj["cwd_option"] = cwd
+
+
+def get_command_config(ctx: click.Context, validate: bool = False) -> "Config":
+    """
+    Load the configuration for a subcommand on first use.
+
+    Args:
+        ctx: Click context of the subcommand
+        validate: Run config.validate() (API key checks); only needed by
+                  commands that run the agent
+
+    Returns:
+        The loaded Config; also stored with the working directory in ctx.obj
+    """
     from config.loader import load_config
-    
-    # Load config
-    try:
-        config = load_config(cwd=cwd)
-        ctx.obj["config"] = config
-        ctx.obj["cwd"] = cwd or config.cwd
-    except Exception as e:
-        console.print(f"[error]Configuration Error: {e}[/error]")
-        ctx.exit(1)
-    
-    errors = config.validate()
-    if errors:
-        for error in errors:
-            console.print(f"[error]{error}[/error]")
-        ctx.exit(1)
+
+    config = ctx.obj.get("config")
+    if config is None:
+        cwd = ctx.obj.get("cwd_option")
+        try:
+            config = load_config(cwd=cwd)
+            ctx.obj["config"] = config
+            ctx.obj["cwd"] = cwd or config.cwd
+        except Exception as e:
+            console.print(f"[error]Configuration Error: {e}[/error]")
+            ctx.exit(1)
+
+    if validate and not ctx.obj.get("validated"):
+        errors = config.validate()
+        if errors:
+            for error in errors:
+                console.print(f"[error]{error}[/error]")
+            ctx.exit(1)
+        ctx.obj["validated"] = True
+
+    return config
 
 
 @oss_dev_group.command(name="fix", help="Start working on a GitHub issue")
@@ -108,27 +806,19 @@ def oss_dev_group(ctx: click.Context, cwd: Optional[Path]):
 @click.pass_context
 def oss_fix(ctx: click.Context, issue_url: str):
     """Start working on a GitHub issue from scratch."""
-    from config.config import Config
     from oss.workflow import OSSWorkflow
-    from agent.agent import Agent
-    from agent.events import AgentEventType
     
-    config: Config = ctx.obj["config"]
+    config: Config = get_command_config(ctx, validate=True)
     cwd: Path = ctx.obj["cwd"]
     
-    if not validate_oss_enabled(config):
+    if not validate_oss_enabled(config, ctx):
         ctx.exit(1)
     
     async def run_fix():
         # Beautiful welcome banner
-        welcome_text = Text()
-        welcome_text.append("🚀 ", style="cyan")
-        welcome_text.append("OSS Dev Agent", style="bold cyan")
-        welcome_text.append(" - Starting workflow", style="cyan")
-        
         welcome_panel = Panel(
             Text(f"Issue: {issue_url}", style="white"),
-            title=welcome_text,
+            title=_FIX_WELCOME_TITLE,
             border_style="cyan",
             box=box.ROUNDED,
             padding=(1, 2),
@@ -140,15 +830,16 @@ def oss_fix(ctx: click.Context, issue_url: str):
         workflow = OSSWorkflow(config, repository_path=cwd)
         
         try:
-            # Start workflow (phases 1-2 execute immediately)
-            state = await workflow.start(issue_url)
+            # Start workflow (phases 1-2 execute immediately) with the agent's
+            # LLM client and MCP connections set up alongside
+            agent, state = await _start_workflow_with_agent(config, workflow, issue_url)
             
             # Display initial workflow status with beautiful formatting
             status_table = Table.grid(padding=(0, 2))
             status_table.add_column(style="cyan bold", justify="right")
             status_table.add_column(style="white")
             
-            status_table.add_row("Phase:", f"[yellow]{state.phase.value.replace('_', ' ').title()}[/yellow]")
+            status_table.add_row("Phase:", f"[yellow]{_phase_display(state.phase.value)}[/yellow]")
             status_table.add_row("Issue:", f"[bold]#{state.issue_number}[/bold]")
             if state.branch_name:
                 status_table.add_row("Branch:", f"[green]{state.branch_name}[/green]")
@@ -168,230 +859,39 @@ def oss_fix(ctx: click.Context, issue_url: str):
             phase_prompt = workflow.get_phase_prompt()
             
             # Create initial message for Agent
-            initial_message = f"""I'm working on GitHub issue: {issue_url}
-
-Current workflow phase: {state.phase.value}
-
-{phase_prompt}
-
-## IMPORTANT: Phase Completion
-After completing each phase, you MUST call the 'workflow_orchestrator' tool with action 'mark_phase_complete' to transition to the next phase.
-
-Example:
-- After completing planning: workflow_orchestrator(action='mark_phase_complete')
-- After completing implementation: workflow_orchestrator(action='mark_phase_complete')
-- After completing verification: workflow_orchestrator(action='mark_phase_complete')
-- And so on for each phase...
-
-The workflow will automatically transition to the next phase when you mark the current one complete.
-
-Use 'workflow_orchestrator' tool with action 'get_status' to check current workflow state at any time."""
+            initial_message = "\n\n".join([
+                f"I'm working on GitHub issue: {issue_url}",
+                f"Current workflow phase: {state.phase.value}",
+                phase_prompt,
+                _PHASE_COMPLETION_GUIDE,
+            ])
             
             # Track current phase for display
-            current_phase_display = state.phase.value.replace("_", " ").title()
-            last_tool_name = None
-            tool_call_count = 0
-            status = None
-            branch_warning_shown = False  # Track if branch warning was already shown
+            current_phase_display = _phase_display(state.phase.value)
             
-            # Run Agent with workflow guidance
-            async with Agent(config) as agent:
-                # Show initial phase
-                console.print(f"\n[bold cyan]📋 Phase: {current_phase_display}[/bold cyan]\n")
-                
-                # Use try/finally to ensure async generator is properly closed
-                event_stream = agent.run(initial_message)
-                try:
-                    async for event in event_stream:
-                        if event.type == AgentEventType.TEXT_DELTA:
-                            # Suppress verbose LLM output - only log to debug
-                            logger.debug(f"LLM text delta: {event.data.get('content', '')[:50]}...")
-                            # Don't print to console - too verbose
-                            pass
-                        elif event.type == AgentEventType.TEXT_COMPLETE:
-                            # Suppress verbose LLM output
-                            logger.debug(f"LLM text complete")
-                            # Don't print to console - too verbose
-                            pass
-                        elif event.type == AgentEventType.TOOL_CALL_START:
-                            tool_name = event.data.get("name", "unknown")
-                            tool_args = event.data.get("arguments", {})
-                            
-                            # Log tool call
-                            logger.debug(f"Tool call started: {tool_name} with args: {tool_args}")
-                            
-                            # Special handling for workflow_orchestrator to show phase transitions
-                            if tool_name == "workflow_orchestrator":
-                                action = tool_args.get("action", "unknown") if isinstance(tool_args, dict) else "unknown"
-                                if action == "mark_phase_complete":
-                                    # Show phase completion
-                                    console.print(f"\n[green]✓[/green] [bold]Phase Complete:[/bold] {current_phase_display}")
-                                elif action == "get_status":
-                                    # Silent - just checking status
-                                    pass
-                                else:
-                                    logger.info(f"Workflow orchestrator called: action={action}")
-                            else:
-                                # Only show tool name if it's different from last one (avoid spam)
-                                if tool_name != last_tool_name:
-                                    tool_call_count += 1
-                                    # Show tool name but keep it minimal
-                                    if tool_call_count <= 3 or tool_name in ["git_branch", "git_commit", "git_push", "create_pr", "create_start_here"]:
-                                        console.print(f"[dim]→ {tool_name}[/dim]")
-                                    last_tool_name = tool_name
-                        elif event.type == AgentEventType.TOOL_CALL_COMPLETE:
-                            tool_name = event.data.get("name", "unknown")
-                            result = event.data.get("output", "")
-                            success = event.data.get("success", False)
-                            
-                            # Log tool completion
-                            logger.debug(f"Tool call completed: {tool_name}, success={success}")
-                            
-                            # Reset last tool name for next iteration
-                            if tool_name == last_tool_name:
-                                last_tool_name = None
-                            
-                            # Handle user confirmation requests
-                            if tool_name == "user_confirm" and "CONFIRMATION_REQUIRED" in result:
-                                # Extract confirmation message
-                                lines = result.split("\n")
-                                confirm_msg = ""
-                                default_yes = True
-                                for line in lines:
-                                    if line.startswith("CONFIRMATION_REQUIRED:"):
-                                        confirm_msg = line.replace("CONFIRMATION_REQUIRED:", "").strip()
-                                    elif "Default:" in line:
-                                        default_yes = "yes" in line.lower()
-                                
-                                # Ask user for confirmation with beautiful formatting
-                                confirm_panel = Panel(
-                                    Text(confirm_msg, style="yellow"),
-                                    title="[bold yellow]❓ Confirmation Required[/bold yellow]",
-                                    border_style="yellow",
-                                    box=box.ROUNDED,
-                                    padding=(1, 2),
-                                )
-                                console.print()
-                                console.print(confirm_panel)
-                                console.print()
-                                
-                                response = click.confirm("[bold]Proceed?[/bold]", default=default_yes)
-                                
-                                if response:
-                                    success_panel = Panel(
-                                        Text("User confirmed. Proceeding with push and PR creation...", style="green"),
-                                        border_style="green",
-                                        box=box.ROUNDED,
-                                        padding=(1, 2),
-                                    )
-                                    console.print()
-                                    console.print(success_panel)
-                                    console.print()
-                                    
-                                    # Inject confirmation result back to agent
-                                    # NOTE: add_tool_result is NOT async, so no await needed
-                                    if agent and agent.session and agent.session.context_manager:
-                                        agent.session.context_manager.add_tool_result(
-                                            event.data.get("call_id", ""),
-                                            "User confirmed: YES. Proceed with push and PR creation."
-                                        )
-                                else:
-                                    branch_name = workflow.state.branch_name or "your-branch"
-                                    decline_content = Text()
-                                    decline_content.append("User declined. Skipping push and PR creation.\n\n", style="yellow")
-                                    decline_content.append("To push manually:\n", style="dim")
-                                    decline_content.append(f"  git push -u origin {branch_name}", style="cyan")
-                                    
-                                    decline_panel = Panel(
-                                        decline_content,
-                                        title="[bold yellow]✗ Action Declined[/bold yellow]",
-                                        border_style="yellow",
-                                        box=box.ROUNDED,
-                                        padding=(1, 2),
-                                    )
-                                    console.print()
-                                    console.print(decline_panel)
-                                    console.print()
-                                    
-                                    # Inject decline result back to agent
-                                    # NOTE: add_tool_result is NOT async, so no await needed
-                                    if agent and agent.session and agent.session.context_manager:
-                                        agent.session.context_manager.add_tool_result(
-                                            event.data.get("call_id", ""),
-                                            "User declined: NO. Skip push and PR creation. Show manual instructions instead."
-                                        )
-                                continue
-                            
-                            # Show phase transitions prominently with beautiful formatting
-                            if tool_name == "workflow_orchestrator" and success:
-                                if "Transitioned to:" in result or "marked complete" in result.lower():
-                                    # Extract new phase
-                                    new_phase = None
-                                    if "Transitioned to:" in result:
-                                        for line in result.split("\n"):
-                                            if "Transitioned to:" in line:
-                                                new_phase = line.split("Transitioned to:")[-1].strip()
-                                                break
-                                    
-                                    if new_phase:
-                                        current_phase_display = new_phase.replace("_", " ").title()
-                                        # Show new phase
-                                        console.print(f"\n[bold cyan]→ Next Phase: {current_phase_display}[/bold cyan]\n")
-                                        logger.info(f"Phase transition: {new_phase}")
-                                        # Reset tool call counter for new phase
-                                        tool_call_count = 0
-                                        last_tool_name = None
-                                        
-                                        # Get updated phase prompt and inject it as a new message to continue
-                                        # CRITICAL: This ensures agent continues working after phase transition
-                                        try:
-                                            new_phase_prompt = workflow.get_phase_prompt()
-                                            continue_message = f"""✅ Phase transition complete! 
-
-🔄 **NEW PHASE: {new_phase.replace('_', ' ').upper()}**
-
-{new_phase_prompt}
-
-**IMPORTANT:** You MUST continue working on this phase. This is NOT the end of the workflow. Complete all required tasks for this phase, then call 'workflow_orchestrator(action='mark_phase_complete')' to proceed to the next phase.
-
-The workflow has {7 - ['repository_understanding', 'issue_intake', 'planning', 'implementation', 'verification', 'validation', 'commit_and_pr'].index(new_phase)} phases remaining. Keep working!"""
-                                            # Inject message to continue workflow - agent's next turn will pick this up
-                                            # NOTE: add_user_message is NOT async, so no await needed
-                                            if agent and agent.session and agent.session.context_manager:
-                                                agent.session.context_manager.add_user_message(continue_message)
-                                                logger.info(f"✅ Injected continue message for phase: {new_phase}")
-                                            else:
-                                                logger.warning("Agent session not available for message injection")
-                                            # Show user that agent will continue
-                                            console.print(f"[dim]→ Agent will continue with {current_phase_display}...[/dim]")
-                                        except Exception as e:
-                                            logger.error(f"❌ Could not inject continue message: {e}")
-                                            console.print(f"[error]Warning: Could not inject continue message. Agent may stop.[/error]")
-                            else:
-                                # Show completion only for important operations
-                                # Avoid duplicate messages by checking if we already showed this tool
-                                important_tools = ["git_branch", "git_commit", "git_push", "create_pr", "create_start_here"]
-                                if tool_name in important_tools:
-                                    if success:
-                                        # Only show once per unique tool call to avoid spam
-                                        if tool_name != last_tool_name:
-                                            console.print(f"[green]✓[/green] [dim]{tool_name}[/dim]")
-                                    else:
-                                        # Always show failures
-                                        console.print(f"[red]✗[/red] [dim]{tool_name} failed[/dim]")
-                        elif event.type == AgentEventType.AGENT_ERROR:
-                            console.print(f"\n[error]{event.data.get('error', 'Unknown error')}[/error]")
-                finally:
-                    # Properly close the async generator to prevent "Task destroyed" warnings
-                    if event_stream is not None:
-                        try:
-                            # Close the async generator properly
-                            await event_stream.aclose()
-                        except (GeneratorExit, StopAsyncIteration):
-                            # These are expected when closing generators
-                            pass
-                        except Exception as e:
-                            logger.debug(f"Error closing event stream: {e}")
+            # Show initial phase
+            console.print(f"\n[bold cyan]📋 Phase: {current_phase_display}[/bold cyan]\n")
+            
+            printer = StreamingPrinter(console)
+            renderer = FixEventRenderer(agent, workflow, current_phase_display, printer)
+            
+            # Use try/finally to ensure async generator is properly closed
+            event_stream = agent.run(initial_message)
+            try:
+                async for event in event_stream:
+                    await renderer.handle(event)
+            finally:
+                printer.flush()
+                # Properly close the async generator to prevent "Task destroyed" warnings
+                if event_stream is not None:
+                    try:
+                        # Close the async generator properly
+                        await event_stream.aclose()
+                    except (GeneratorExit, StopAsyncIteration):
+                        # These are expected when closing generators
+                        pass
+                    except Exception as e:
+                        logger.debug(f"Error closing event stream: {e}")
             
         except ValueError as e:
             console.print(f"[error]Invalid issue URL: {e}[/error]")
@@ -400,17 +900,7 @@ The workflow has {7 - ['repository_understanding', 'issue_intake', 'planning', '
             console.print(f"[error]Failed to start OSS workflow: {e}[/error]")
             ctx.exit(1)
     
-    # Run async function - use new event loop
-    import sys
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-    
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(run_fix())
-    finally:
-        loop.close()
+    run_async(run_fix())
 
 
 @oss_dev_group.command(name="review", help="Work on an issue in the current repository")
@@ -418,16 +908,13 @@ The workflow has {7 - ['repository_understanding', 'issue_intake', 'planning', '
 @click.pass_context
 def oss_review(ctx: click.Context, issue_number: int):
     """Work on an issue when already in the repository."""
-    from config.config import Config
     from oss.workflow import OSSWorkflow
     from oss.memory import BranchMemoryManager
-    from agent.agent import Agent
-    from agent.events import AgentEventType
     
-    config: Config = ctx.obj["config"]
+    config: Config = get_command_config(ctx, validate=True)
     cwd: Path = ctx.obj["cwd"]
     
-    if not validate_oss_enabled(config):
+    if not validate_oss_enabled(config, ctx):
         ctx.exit(1)
     
     # Get repo from current directory
@@ -445,13 +932,7 @@ def oss_review(ctx: click.Context, issue_number: int):
     
     # Check if branch already exists for this issue
     memory_manager = BranchMemoryManager(cwd)
-    branches = memory_manager.list_branches()
-    existing_branch = None
-    
-    for branch_data in branches:
-        if branch_data.get("issue_number") == issue_number:
-            existing_branch = branch_data.get("branch_name")
-            break
+    existing_branch = memory_manager.find_branch_for_issue(issue_number)
     
     if existing_branch:
         console.print(
@@ -468,7 +949,7 @@ def oss_review(ctx: click.Context, issue_number: int):
         workflow = OSSWorkflow(config, repository_path=cwd)
         
         try:
-            state = await workflow.start(issue_url)
+            agent, state = await _start_workflow_with_agent(config, workflow, issue_url)
             phase_prompt = workflow.get_phase_prompt()
             
             initial_message = f"""I'm working on GitHub issue: {issue_url}
@@ -479,50 +960,25 @@ Current workflow phase: {state.phase.value}
 
 Please use the 'workflow_orchestrator' tool to manage the workflow and proceed through the phases."""
             
-            async with Agent(config) as agent:
-                async for event in agent.run(initial_message):
-                    if event.type == AgentEventType.TEXT_DELTA:
-                        console.print(event.data.get("content", ""), end="")
-                    elif event.type == AgentEventType.TEXT_COMPLETE:
-                        console.print(event.data.get("content", ""))
-                    elif event.type == AgentEventType.TOOL_CALL_START:
-                        tool_name = event.data.get("name", "unknown")
-                        console.print(f"\n[dim]🔧 Using tool: {tool_name}[/dim]")
-                    elif event.type == AgentEventType.TOOL_CALL_COMPLETE:
-                        console.print("[dim]Tool complete[/dim]")
-                    elif event.type == AgentEventType.AGENT_ERROR:
-                        console.print(f"\n[error]{event.data.get('error', 'Unknown error')}[/error]")
+            await _stream_agent_run(agent, initial_message, console)
         
         except Exception as e:
             console.print(f"[error]Failed to start OSS workflow: {e}[/error]")
             ctx.exit(1)
     
-    # Run async function
-    import sys
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-    
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(run_review())
-    finally:
-        loop.close()
+    run_async(run_review())
 
 
 @oss_dev_group.command(name="resume", help="Continue work on current branch")
 @click.pass_context
 def oss_resume(ctx: click.Context):
     """Continue work on current branch."""
-    from config.config import Config
     from oss.workflow import OSSWorkflow
-    from agent.agent import Agent
-    from agent.events import AgentEventType
     
-    config: Config = ctx.obj["config"]
+    config: Config = get_command_config(ctx, validate=True)
     cwd: Path = ctx.obj["cwd"]
     
-    if not validate_oss_enabled(config):
+    if not validate_oss_enabled(config, ctx):
         ctx.exit(1)
     
     async def run_resume():
@@ -553,57 +1009,44 @@ Continue from where we left off."""
             console.print(f"[bold]Resuming workflow on branch: {state.branch_name or 'unknown'}[/bold]")
             console.print(f"[dim]Issue: #{state.issue_number} | Phase: {state.phase.value}[/dim]\n")
             
-            async with Agent(config) as agent:
-                async for event in agent.run(initial_message):
-                    if event.type == AgentEventType.TEXT_DELTA:
-                        console.print(event.data.get("content", ""), end="")
-                    elif event.type == AgentEventType.TEXT_COMPLETE:
-                        console.print(event.data.get("content", ""))
-                    elif event.type == AgentEventType.TOOL_CALL_START:
-                        tool_name = event.data.get("name", "unknown")
-                        console.print(f"\n[dim]🔧 Using tool: {tool_name}[/dim]")
-                    elif event.type == AgentEventType.TOOL_CALL_COMPLETE:
-                        console.print("[dim]Tool complete[/dim]")
-                    elif event.type == AgentEventType.AGENT_ERROR:
-                        console.print(f"\n[error]{event.data.get('error', 'Unknown error')}[/error]")
+            agent = await get_or_create_agent(config)
+            await _stream_agent_run(agent, initial_message, console)
         
         except Exception as e:
             console.print(f"[error]Failed to resume workflow: {e}[/error]")
             ctx.exit(1)
     
-    # Run async function
-    import sys
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-    
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(run_resume())
-    finally:
-        loop.close()
+    run_async(run_resume())
 
 
 @oss_dev_group.command(name="status", help="Show current work status")
+@click.option(
+    "--tracked-only",
+    is_flag=True,
+    help="Don't list untracked files (faster in large workspaces)",
+)
 @click.pass_context
-def oss_status(ctx: click.Context):
+def oss_status(ctx: click.Context, tracked_only: bool):
     """Show current work status."""
-    from config.config import Config
     from oss.workflow import OSSWorkflow
     from oss.memory import BranchMemoryManager
     
-    config: Config = ctx.obj["config"]
+    config: Config = get_command_config(ctx)
     cwd: Path = ctx.obj["cwd"]
     
-    if not validate_oss_enabled(config):
+    if not validate_oss_enabled(config, ctx):
         ctx.exit(1)
     
+    # Branch and uncommitted changes from one git call, started first so git
+    # runs while the workflow state is loaded
+    git_proc = _start_repo_state(cwd, untracked=not tracked_only)
+    
     workflow = OSSWorkflow(config, repository_path=cwd)
     phase_info = workflow.get_current_phase_info()
     memory_manager = BranchMemoryManager(cwd)
     
-    # Get current branch
-    current_branch = memory_manager.get_current_branch()
+    repo_state = _collect_repo_state(cwd, git_proc) if git_proc else None
+    current_branch = repo_state.current_branch if repo_state else None
     
     # Beautiful status display
     status_table = Table.grid(padding=(0, 2))
@@ -620,7 +1063,7 @@ def oss_status(ctx: click.Context):
         if phase_info.get('issue_url'):
             status_table.add_row("URL:", f"[dim]{phase_info['issue_url']}[/dim]")
     
-    status_table.add_row("Phase:", f"[yellow]{phase_info['phase'].replace('_', ' ').title()}[/yellow]")
+    status_table.add_row("Phase:", f"[yellow]{_phase_display(phase_info['phase'])}[/yellow]")
     status_table.add_row("Changes:", "[green]✓ Yes[/green]" if phase_info.get('changes_made') else "[dim]No[/dim]")
     status_table.add_row("Tests:", "[green]✓ Passed[/green]" if phase_info.get('tests_passed') else "[dim]Not run[/dim]")
     
@@ -662,26 +1105,20 @@ def oss_status(ctx: click.Context):
                 console.print(summary_panel)
     
     # Show git status if in repo
-    try:
-        result = subprocess.run(
-            ["git", "status", "--short"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True,
+    if repo_state and repo_state.uncommitted:
+        changes = repo_state.uncommitted[:_MAX_STATUS_ENTRIES]
+        hidden = len(repo_state.uncommitted) - len(changes)
+        if hidden:
+            changes.append(f"... and {hidden} more")
+        changes_panel = Panel(
+            "\n".join(changes),
+            title="[bold]Uncommitted Changes[/bold]",
+            border_style="yellow",
+            box=box.ROUNDED,
+            padding=(1, 2),
         )
-        if result.stdout.strip():
-            changes_panel = Panel(
-                result.stdout,
-                title="[bold]Uncommitted Changes[/bold]",
-                border_style="yellow",
-                box=box.ROUNDED,
-                padding=(1, 2),
-            )
-            console.print()
-            console.print(changes_panel)
-    except Exception:
-        pass
+        console.print()
+        console.print(changes_panel)
     
     console.print()
 
@@ -690,17 +1127,17 @@ def oss_status(ctx: click.Context):
 @click.pass_context
 def oss_list(ctx: click.Context):
     """List active branches with issues."""
-    from config.config import Config
     from oss.memory import BranchMemoryManager
     
-    config: Config = ctx.obj["config"]
+    config: Config = get_command_config(ctx)
     cwd: Path = ctx.obj["cwd"]
     
-    if not validate_oss_enabled(config):
+    if not validate_oss_enabled(config, ctx):
         ctx.exit(1)
     
     memory_manager = BranchMemoryManager(cwd)
-    branches = memory_manager.list_branches()
+    # One read per memory file, summaries included
+    branches = memory_manager.list_branches_with_summaries()
     
     if not branches:
         console.print("[dim]No active branches found.[/dim]")
@@ -711,6 +1148,9 @@ def oss_list(ctx: click.Context):
     
     current_branch = memory_manager.get_current_branch()
     
+    # Built as one Text and printed once: no markup parsing per row, and
+    # summaries containing "[" print as written
+    listing = Text()
     for branch_data in branches:
         branch_name = branch_data.get("branch_name", "unknown")
         issue_num = branch_data.get("issue_number")
@@ -720,25 +1160,26 @@ def oss_list(ctx: click.Context):
         
         # Highlight current branch
         if branch_name == current_branch:
-            branch_display = f"[bold cyan]* {branch_name}[/bold cyan]"
+            listing.append(f"* {branch_name}\n", style="bold cyan")
         else:
-            branch_display = f"  {branch_name}"
-        
-        console.print(branch_display)
+            listing.append(f"  {branch_name}\n")
         
         if issue_num:
-            console.print(f"    Issue: [cyan]#{issue_num}[/cyan]")
-        console.print(f"    Phase: [yellow]{phase}[/yellow] | Status: {status}")
+            listing.append("    Issue: ").append(f"#{issue_num}", style="cyan").append("\n")
+        listing.append("    Phase: ").append(str(phase), style="yellow").append(f" | Status: {status}\n")
         
         if pr_url:
-            console.print(f"    PR: [cyan]{pr_url}[/cyan]")
+            listing.append("    PR: ").append(pr_url, style="cyan").append("\n")
         
         # Show context summary if available
-        summary = memory_manager.get_branch_summary(branch_name)
-        if summary.get("context_summary"):
-            console.print(f"    Context: [dim]{summary['context_summary'][:60]}...[/dim]")
+        if branch_data.get("context_summary"):
+            listing.append("    Context: ").append(
+                f"{branch_data['context_summary'][:60]}...", style="dim"
+            ).append("\n")
         
-        console.print()
+        listing.append("\n")
+    
+    console.print(listing, end="")
     
     if current_branch:
         console.print(f"[dim]* Current branch[/dim]\n")
@@ -749,16 +1190,13 @@ def oss_list(ctx: click.Context):
 @click.pass_context
 def oss_switch(ctx: click.Context, target: str):
     """Switch to a different branch or issue."""
-    from config.config import Config
     from oss.workflow import OSSWorkflow
     from oss.memory import BranchMemoryManager
-    from agent.agent import Agent
-    from agent.events import AgentEventType
     
-    config: Config = ctx.obj["config"]
+    config: Config = get_command_config(ctx, validate=True)
     cwd: Path = ctx.obj["cwd"]
     
-    if not validate_oss_enabled(config):
+    if not validate_oss_enabled(config, ctx):
         ctx.exit(1)
     
     memory_manager = BranchMemoryManager(cwd)
@@ -767,13 +1205,7 @@ def oss_switch(ctx: click.Context, target: str):
     try:
         issue_number = int(target)
         # Find branch for this issue
-        branches = memory_manager.list_branches()
-        target_branch = None
-        
-        for branch_data in branches:
-            if branch_data.get("issue_number") == issue_number:
-                target_branch = branch_data.get("branch_name")
-                break
+        target_branch = memory_manager.find_branch_for_issue(issue_number)
         
         if not target_branch:
             console.print(
@@ -836,34 +1268,14 @@ Continue from where we left off."""
             
             console.print("\n[bold]Resuming workflow...[/bold]\n")
             
-            async with Agent(config) as agent:
-                async for event in agent.run(initial_message):
-                    if event.type == AgentEventType.TEXT_DELTA:
-                        console.print(event.data.get("content", ""), end="")
-                    elif event.type == AgentEventType.TEXT_COMPLETE:
-                        console.print(event.data.get("content", ""))
-                    elif event.type == AgentEventType.TOOL_CALL_START:
-                        tool_name = event.data.get("name", "unknown")
-                        console.print(f"\n[dim]🔧 Using tool: {tool_name}[/dim]")
-                    elif event.type == AgentEventType.TOOL_CALL_COMPLETE:
-                        console.print("[dim]Tool complete[/dim]")
-                    elif event.type == AgentEventType.AGENT_ERROR:
-                        console.print(f"\n[error]{event.data.get('error', 'Unknown error')}[/error]")
+            agent = await get_or_create_agent(config)
+            await _stream_agent_run(agent, initial_message, console)
         
-        # Run async function
-        import sys
-        if sys.platform == "win32":
-            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-        
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(run_resume())
-        finally:
-            loop.close()
+        run_async(run_resume())
     else:
-        console.print(
-            f"[error]No memory found for branch: {target}[/error]\n"
-            f"Use 'oss-dev review <issue_number>' to start working on an issue."
-        )
+        # Text rather than markup: the target is user input and may contain "["
+        console.print(Text.assemble(
+            (f"No memory found for branch: {target}", "error"),
+            "\nUse 'oss-dev review <issue_number>' to start working on an issue.",
+        ))
         ctx.exit(1)
@@ -14,6 +14,7 @@ from client.response import (
     ToolCallDelta,
     parse_tool_call_arguments,
 )
+from client.response_cache import ResponseCache, ResponseRecorder, replay_response
 from config.config import Config
 
 
@@ -21,6 +22,10 @@ class LLMClient:
     def __init__(self, config: Config) -> None:
         self._client: AsyncOpenAI | None = None
         self._max_retries: int = 3
+        self._system_message: dict[str, Any] | None = None
+        self._tools_source: list[dict[str, Any]] | None = None
+        self._built_tools: list[dict[str, Any]] | None = None
+        self._response_cache: ResponseCache | None = None
         self.config = config
 
     def get_client(self) -> AsyncOpenAI:
@@ -65,32 +70,102 @@ class LLMClient:
             for tool in tools
         ]
 
+    def _parse_usage(self, raw_usage: Any) -> TokenUsage:
+        # Cached prompt tokens are reported as prompt_tokens_details.cached_tokens
+        # (OpenAI-compatible) or cache_read_input_tokens (Anthropic-style); either
+        # may be missing depending on the provider
+        details = getattr(raw_usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens is None:
+            cached_tokens = getattr(raw_usage, "cache_read_input_tokens", None)
+
+        return TokenUsage(
+            prompt_tokens=raw_usage.prompt_tokens or 0,
+            completion_tokens=raw_usage.completion_tokens or 0,
+            total_tokens=raw_usage.total_tokens or 0,
+            cached_tokens=cached_tokens or 0,
+        )
+
+    def _get_response_cache(self, stream: bool) -> ResponseCache | None:
+        # Replaying a stored response is only valid for deterministic sampling.
+        # Only streamed responses carry their tool calls as events, so those
+        # are the only ones that can be recorded completely.
+        if (
+            not stream
+            or not self.config.model.response_cache
+            or self.config.temperature != 0
+        ):
+            return None
+        if self._response_cache is None:
+            self._response_cache = ResponseCache()
+        return self._response_cache
+
+    def _get_system_message(self, system_prompt: str) -> dict[str, Any]:
+        # Reuse the same system message across turns so the persistent prefix
+        # stays identical and can be served from the provider's prompt cache
+        if self._system_message is None or self._system_message["content"] != system_prompt:
+            self._system_message = {
+                "role": "system",
+                "content": system_prompt,
+            }
+        return self._system_message
+
     async def chat_completion(
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None = None,
         stream: bool = True,
+        system_prompt: str | None = None,
     ) -> AsyncGenerator[StreamEvent, None]:
         client = self.get_client()
 
+        if system_prompt:
+            messages = [self._get_system_message(system_prompt), *messages]
+
         kwargs = {
             "model": self.config.model_name,
             "messages": messages,
             "stream": stream,
+            "temperature": self.config.temperature,
         }
 
         if tools:
-            kwargs["tools"] = self._build_tools(tools)
+            # Tool schemas come from the registry cache, so rebuild the wire
+            # format only when a different schema list is passed in
+            if tools is not self._tools_source:
+                self._tools_source = tools
+                self._built_tools = self._build_tools(tools)
+            kwargs["tools"] = self._built_tools
             kwargs["tool_choice"] = "auto"
 
+        response_cache = self._get_response_cache(stream)
+        cache_key: str | None = None
+        if response_cache:
+            cache_key = response_cache.make_key(
+                {key: value for key, value in kwargs.items() if key != "tool_choice"}
+            )
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                for event in replay_response(cached):
+                    yield event
+                return
+
         for attempt in range(self._max_retries + 1):
+            recorder = ResponseRecorder() if response_cache else None
             try:
                 if stream:
                     async for event in self._stream_response(client, kwargs):
+                        if recorder:
+                            recorder.record(event)
                         yield event
                 else:
                     event = await self._non_stream_response(client, kwargs)
+                    if recorder:
+                        recorder.record(event)
                     yield event
+
+                if recorder and recorder.cacheable:
+                    response_cache.set(cache_key, recorder.to_record())
                 return
             except RateLimitError as e:
                 if attempt < self._max_retries:
@@ -132,12 +207,7 @@ class LLMClient:
 
         async for chunk in response:
             if hasattr(chunk, "usage") and chunk.usage:
-                usage = TokenUsage(
-                    prompt_tokens=chunk.usage.prompt_tokens,
-                    completion_tokens=chunk.usage.completion_tokens,
-                    total_tokens=chunk.usage.total_tokens,
-                    cached_tokens=chunk.usage.prompt_tokens_details.cached_tokens,
-                )
+                usage = self._parse_usage(chunk.usage)
 
             if not chunk.choices:
                 continue
@@ -234,12 +304,7 @@ class LLMClient:
 
         usage = None
         if response.usage:
-            usage = TokenUsage(
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                total_tokens=response.usage.total_tokens,
-                cached_tokens=response.usage.prompt_tokens_details.cached_tokens,
-            )
+            usage = self._parse_usage(response.usage)
 
         return StreamEvent(
             type=StreamEventType.MESSAGE_COMPLETE,
@@ -1,9 +1,14 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 import json
 
+try:
+    import orjson
+except ImportError:  # optional, json is used when it isn't installed
+    orjson = None
+
 
 @dataclass
 class TextDelta:
@@ -51,6 +56,38 @@ class ToolCall:
     call_id: str
     name: str | None = None
     arguments: str = ""
+    _openai_tool_call: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parsed_arguments: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def parsed_arguments(self) -> dict[str, Any]:
+        """Return the arguments as a dict, parsing them at most once."""
+        if self._parsed_arguments is None:
+            self._parsed_arguments = parse_tool_call_arguments(self.arguments)
+        return self._parsed_arguments
+
+    def to_openai_tool_call(self) -> dict[str, Any]:
+        """Convert to the tool_calls entry of an OpenAI-compatible assistant message.
+
+        The dict is built once per tool call and reused afterwards.
+        """
+        if self._openai_tool_call is None:
+            arguments = self.arguments
+            if not isinstance(arguments, str):
+                arguments = json.dumps(arguments or {})
+
+            self._openai_tool_call = {
+                "id": self.call_id,
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "arguments": arguments,
+                },
+            }
+        return self._openai_tool_call
 
 
 @dataclass
@@ -64,7 +101,7 @@ class StreamEvent:
     usage: TokenUsage | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResultMessage:
     tool_call_id: str
     content: str
@@ -83,11 +120,16 @@ class ToolResultMessage:
         }
 
 
-def parse_tool_call_arguments(arguments_str: str) -> dict[str, Any]:
-    if not arguments_str:
+def parse_tool_call_arguments(arguments_str: str | dict[str, Any] | None) -> dict[str, Any]:
+    if not arguments_str or arguments_str == "{}":
         return {}
+    if isinstance(arguments_str, dict):
+        return arguments_str
 
     try:
+        if orjson is not None:
+            return orjson.loads(arguments_str)
         return json.loads(arguments_str)
     except json.JSONDecodeError:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         return {"raw_arguments": arguments_str}
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from client.response import (
+    StreamEvent,
+    StreamEventType,
+    TextDelta,
+    TokenUsage,
+    ToolCall,
+)
+from config.loader import get_data_dir
+
+
+class ResponseCache:
+    """On-disk cache of completed LLM responses for deterministic requests.
+
+    Only safe for temperature 0 requests: the same prompt is expected to
+    produce the same response, so a cached one can be replayed instead.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir or get_data_dir() / "cache" / "responses"
+
+    def make_key(self, request: dict[str, Any]) -> str:
+        payload = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, record: dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            path.write_text(json.dumps(record), encoding="utf-8")
+        except OSError:
+            pass
+
+
+class ResponseRecorder:
+    """Collects the events of one response into a cacheable record."""
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.tool_calls: list[dict[str, Any]] = []
+        self.finish_reason: str | None = None
+        self.usage: dict[str, int] | None = None
+        self.failed = False
+        self.complete = False
+
+    def record(self, event: StreamEvent) -> None:
+        if event.type == StreamEventType.TEXT_DELTA and event.text_delta:
+            self.text += event.text_delta.content
+        elif event.type == StreamEventType.TOOL_CALL_COMPLETE and event.tool_call:
+            self.tool_calls.append(
+                {
+                    "call_id": event.tool_call.call_id,
+                    "name": event.tool_call.name,
+                    "arguments": event.tool_call.arguments,
+                }
+            )
+        elif event.type == StreamEventType.MESSAGE_COMPLETE:
+            if event.text_delta:
+                self.text += event.text_delta.content
+            self.finish_reason = event.finish_reason
+            self.complete = True
+            self.usage = event.usage.__dict__ if event.usage else None
+        elif event.type == StreamEventType.ERROR:
+            self.failed = True
+
+    @property
+    def cacheable(self) -> bool:
+        return self.complete and not self.failed
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "text": self.text,
+            "tool_calls": self.tool_calls,
+            "finish_reason": self.finish_reason,
+            "usage": self.usage,
+        }
+
+
+def replay_response(record: dict[str, Any]) -> list[StreamEvent]:
+    """Rebuild the stream events of a cached streamed response."""
+    usage = TokenUsage(**record["usage"]) if record.get("usage") else None
+    text = record.get("text") or ""
+
+    events: list[StreamEvent] = []
+    if text:
+        events.append(
+            StreamEvent(type=StreamEventType.TEXT_DELTA, text_delta=TextDelta(text))
+        )
+    for tc in record.get("tool_calls") or []:
+        events.append(
+            StreamEvent(
+                type=StreamEventType.TOOL_CALL_COMPLETE,
+                tool_call=ToolCall(
+                    call_id=tc["call_id"],
+                    name=tc.get("name") or "",
+                    arguments=tc.get("arguments", ""),
+                ),
+            )
+        )
+    events.append(
+        StreamEvent(
+            type=StreamEventType.MESSAGE_COMPLETE,
+            finish_reason=record.get("finish_reason"),
+            usage=usage,
+        )
+    )
+    return events
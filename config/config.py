@@ -3,7 +3,7 @@ from enum import Enum
 import os
 from pathlib import Path
 from typing import Any
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ModelConfig(BaseModel):
@@ -25,6 +25,10 @@ class ModelConfig(BaseModel):
         default="gemini",
         description="LLM provider: 'gemini' (primary) or 'openai' (fallback/dev only)",
     )
+    response_cache: bool = Field(
+        default=False,
+        description="Cache streamed responses on disk and replay them for identical requests. Only used when temperature is 0.",
+    )
 
 
 class ShellEnvironmentPolicy(BaseModel):
@@ -36,6 +40,10 @@ class ShellEnvironmentPolicy(BaseModel):
 
 
 class MCPServerConfig(BaseModel):
+    # Only validated as part of Config; building a standalone validator at
+    # import time is wasted work for the common no-MCP-servers case
+    model_config = ConfigDict(defer_build=True)
+
     enabled: bool = True
     startup_timeout_sec: float = 10
 
@@ -84,6 +92,8 @@ class HookTrigger(str, Enum):
 
 
 class HookConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     trigger: HookTrigger
     command: str | None = None  # python3 tests.py
@@ -195,8 +205,8 @@ class Config(BaseModel):
     def temperature(self) -> float:
         return self.model.temperature
 
-    @model_name.setter
-    def temperature(self, value: str) -> None:
+    @temperature.setter
+    def temperature(self, value: float) -> None:
         self.model.temperature = value
 
     def validate(self) -> list[str]:
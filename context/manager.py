@@ -1,13 +1,18 @@
 from datetime import datetime
 from typing import Any
-from client.response import TokenUsage
+from client.response import TokenUsage, ToolCall
 from config.config import Config
 from prompts.system import get_system_prompt
 from dataclasses import dataclass, field
 
-from tools.base import Tool
+from tools.base import Tool, ToolResult
 from utils.text import count_tokens
 
+# Filler result for tool calls that never got one, built once
+NOT_PROCESSED_OUTPUT = ToolResult.error_result(error="Tool call was not processed").to_model_output()
+# Content left in place of a pruned tool result
+PRUNED_OUTPUT = "[Old tool result content cleared]"
+
 
 @dataclass
 class MessageItem:
@@ -15,6 +20,8 @@ class MessageItem:
     content: str
     tool_call_id: str | None = None
     tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    # ids of tool_calls, set once when the message is added
+    tool_call_ids: frozenset[str] = frozenset()
     token_count: int | None = None
     pruned_at: datetime | None = None
 
@@ -36,6 +43,8 @@ class MessageItem:
 class ContextManager:
     PRUNE_PROTECT_TOKENS = 40_000
     PRUNE_MINIMUM_TOKENS = 20_000
+    # Fraction of the context window after which old tool outputs get pruned
+    PRUNE_THRESHOLD = 0.7
 
     def __init__(
         self,
@@ -47,9 +56,23 @@ class ContextManager:
         self.config = config
         self._model_name = self.config.model_name
         self._messages: list[MessageItem] = []
+        # to_dict() of the leading self._messages that have already been
+        # serialized. Appends only convert the new tail; anything that edits
+        # or inserts into history resets it.
+        self._message_dicts: list[dict[str, Any]] = []
+        # Leading self._messages already checked by _validate_message_history.
+        # Appends can't invalidate them, except for the tool results of a
+        # trailing assistant message, so the mark stops before that message.
+        self._validated_count = 0
+        # Kept up to date by add_user_message/replace_with_summary for pruning
+        self._user_message_count = 0
         self._latest_usage = TokenUsage()
         self.total_usage = TokenUsage()
 
+    @property
+    def system_prompt(self) -> str | None:
+        return self._system_prompt
+
     @property
     def message_count(self) -> int:
         return len(self._messages)
@@ -65,12 +88,19 @@ class ContextManager:
         )
 
         self._messages.append(item)
+        self._user_message_count += 1
 
     def add_assistant_message(
         self,
         content: str,
-        tool_calls: list[dict[str, any]] | None = None,
+        tool_calls: list[ToolCall | dict[str, Any]] | None = None,
     ) -> None:
+        # ToolCall objects carry their own cached wire-format dict;
+        # dicts (e.g. from a saved session) are stored as they are
+        tool_call_dicts = [
+            tc.to_openai_tool_call() if isinstance(tc, ToolCall) else tc
+            for tc in tool_calls or ()
+        ]
         item = MessageItem(
             role="assistant",
             content=content or "",
@@ -78,7 +108,10 @@ class ContextManager:
                 content or "",
                 self._model_name,
             ),
-            tool_calls=tool_calls or [],
+            tool_calls=tool_call_dicts,
+            tool_call_ids=frozenset(
+                tc["id"] for tc in tool_call_dicts if isinstance(tc, dict) and "id" in tc
+            ),
         )
 
         self._messages.append(item)
@@ -93,47 +126,71 @@ class ContextManager:
             insert_after_assistant_index: If provided, insert immediately after this assistant message index.
                                           This ensures tool results immediately follow assistant messages with tool_calls.
         """
-        # Ensure content is never None or empty - API requires a string
-        if content is None:
-            content = ""
-        elif not isinstance(content, str):
-            content = str(content)
-        
-        item = MessageItem(
-            role="tool",
-            content=content,
-            tool_call_id=tool_call_id,
-            token_count=count_tokens(content, self._model_name),
+        self.add_tool_results(
+            [(tool_call_id, content)],
+            insert_after_assistant_index=insert_after_assistant_index,
         )
 
+    def add_tool_results(
+        self,
+        results: list[tuple[str, str]],
+        insert_after_assistant_index: int | None = None,
+    ) -> None:
+        """
+        Add several tool results to the message history in one operation.
+
+        Args:
+            results: (tool_call_id, content) pairs, in the order they should appear
+            insert_after_assistant_index: If provided, insert immediately after this assistant message index
+                                          (after any existing tool results), as in add_tool_result.
+        """
+        items = []
+        for tool_call_id, content in results:
+            # Ensure content is never None or empty - API requires a string
+            if content is None:
+                content = ""
+            elif not isinstance(content, str):
+                content = str(content)
+
+            items.append(
+                MessageItem(
+                    role="tool",
+                    content=content,
+                    tool_call_id=tool_call_id,
+                    token_count=count_tokens(content, self._model_name),
+                )
+            )
+
         if insert_after_assistant_index is not None:
             # Insert immediately after the assistant message (after any existing tool results for that message)
             insert_pos = insert_after_assistant_index + 1
             # Skip any existing tool results
-            while (insert_pos < len(self._messages) and 
+            while (insert_pos < len(self._messages) and
                    self._messages[insert_pos].role == "tool"):
                 insert_pos += 1
-            self._messages.insert(insert_pos, item)
+            if insert_pos < len(self._messages):
+                self._message_dicts = []
+            self._validated_count = min(self._validated_count, insert_after_assistant_index)
+            # Single splice instead of one list.insert per result
+            self._messages[insert_pos:insert_pos] = items
         else:
             # Default: append to end (for backward compatibility)
-            self._messages.append(item)
+            self._messages.extend(items)
 
     def _validate_message_history(self) -> None:
         """
         Validate that every assistant message with tool_calls has corresponding tool results
         IMMEDIATELY following it. The API requires this strict ordering.
         Tool results MUST come right after assistant message, before any user messages.
+
+        Only messages after the already validated prefix are checked.
         """
-        i = 0
+        validated_count = None
+        i = self._validated_count
         while i < len(self._messages):
             item = self._messages[i]
             if item.role == "assistant" and item.tool_calls:
-                # Collect all tool_call_ids from this assistant message
-                tool_call_ids = set()
-                for tc in item.tool_calls:
-                    if isinstance(tc, dict) and "id" in tc:
-                        tool_call_ids.add(tc["id"])
-                
+                tool_call_ids = item.tool_call_ids
                 if tool_call_ids:
                     # Check what immediately follows this assistant message
                     found_tool_result_ids = set()
@@ -144,6 +201,9 @@ class ContextManager:
                         if tool_result_id:
                             found_tool_result_ids.add(tool_result_id)
                         j += 1
+                    # Results may still be appended to a block that runs to the
+                    # end of history, so it is checked again next time
+                    validated_count = i if j == len(self._messages) else None
                     
                     # Find missing tool_call_ids
                     missing_ids = tool_call_ids - found_tool_result_ids
@@ -151,31 +211,29 @@ class ContextManager:
                         # Insert error results IMMEDIATELY after assistant message (before any user messages)
                         # Insert right after the assistant message, before any existing tool results or user messages
                         insert_position = i + 1
-                        from tools.base import ToolResult
                         for missing_id in missing_ids:
-                            error_result = ToolResult.error_result(
-                                error="Tool call was not processed",
-                                output="",
-                            )
                             error_item = MessageItem(
                                 role="tool",
-                                content=error_result.to_model_output(),
+                                content=NOT_PROCESSED_OUTPUT,
                                 tool_call_id=missing_id,
-                                token_count=count_tokens(error_result.to_model_output(), self._model_name),
+                                token_count=count_tokens(NOT_PROCESSED_OUTPUT, self._model_name),
                             )
                             self._messages.insert(insert_position, error_item)
+                            self._message_dicts = []
                             insert_position += 1
                             # Update i to account for inserted item
                             i += 1
             i += 1
 
-    def get_messages(self) -> list[dict[str, Any]]:
+        self._validated_count = len(self._messages) if validated_count is None else validated_count
+
+    def get_messages(self, include_system: bool = True) -> list[dict[str, Any]]:
         # Validate message history before returning
         self._validate_message_history()
         
         messages = []
 
-        if self._system_prompt:
+        if include_system and self._system_prompt:
             messages.append(
                 {
                     "role": "system",
@@ -183,8 +241,12 @@ class ContextManager:
                 }
             )
 
-        for item in self._messages:
-            messages.append(item.to_dict())
+        serialized = len(self._message_dicts)
+        if serialized < len(self._messages):
+            self._message_dicts.extend(
+                item.to_dict() for item in self._messages[serialized:]
+            )
+        messages.extend(self._message_dicts)
 
         return messages
 
@@ -194,6 +256,12 @@ class ContextManager:
 
         return current_tokens > (context_limit * 0.8)
 
+    def needs_pruning(self) -> bool:
+        context_limit = self.config.model.context_window
+        current_tokens = self._latest_usage.total_tokens
+
+        return current_tokens > (context_limit * self.PRUNE_THRESHOLD)
+
     def set_latest_usage(self, usage: TokenUsage):
         self._latest_usage = usage
 
@@ -202,6 +270,8 @@ class ContextManager:
 
     def replace_with_summary(self, summary: str) -> None:
         self._messages = []
+        self._message_dicts = []
+        self._validated_count = 0
 
         continuation_content = f"""# Context Restoration (Previous Session Compacted)
 
@@ -249,18 +319,20 @@ I'll continue with the REMAINING tasks only, starting from where we left off."""
             token_count=count_tokens(continue_content, self._model_name),
         )
         self._messages.append(continue_item)
+        self._user_message_count = 2
 
     def prune_tool_outputs(self) -> int:
-        user_message_count = sum(1 for msg in self._messages if msg.role == "user")
-
-        if user_message_count < 2:
+        if self._user_message_count < 2:
             return 0
 
         total_tokens = 0
         pruned_tokens = 0
-        to_prune: list[MessageItem] = []
+        # Indices of the tool results to clear, newest first
+        to_prune: list[int] = []
 
-        for msg in reversed(self._messages):
+        messages = self._messages
+        for index in range(len(messages) - 1, -1, -1):
+            msg = messages[index]
             if msg.role == "tool" and msg.tool_call_id:
                 if msg.pruned_at:
                     break
@@ -270,20 +342,29 @@ I'll continue with the REMAINING tasks only, starting from where we left off."""
 
                 if total_tokens > self.PRUNE_PROTECT_TOKENS:
                     pruned_tokens += tokens
-                    to_prune.append(msg)
+                    to_prune.append(index)
 
+        # Nothing is changed unless enough can be freed, so the scan has to
+        # finish before any message is touched
         if pruned_tokens < self.PRUNE_MINIMUM_TOKENS:
             return 0
 
-        pruned_count = 0
+        pruned_output_tokens = count_tokens(PRUNED_OUTPUT, self._model_name)
+        pruned_at = datetime.now()
+
+        for index in to_prune:
+            msg = messages[index]
+            msg.content = PRUNED_OUTPUT
+            msg.token_count = pruned_output_tokens
+            msg.pruned_at = pruned_at
 
-        for msg in to_prune:
-            msg.content = "[Old tool result content cleared]"
-            msg.token_count = count_tokens(msg.content, self._model_name)
-            msg.pruned_at = datetime.now()
-            pruned_count += 1
+        # Messages before the oldest pruned one keep their serialized dicts
+        del self._message_dicts[to_prune[-1]:]
 
-        return pruned_count
+        return len(to_prune)
 
     def clear(self) -> None:
         self._messages = []
+        self._message_dicts = []
+        self._validated_count = 0
+        self._user_message_count = 0
@@ -1,6 +1,7 @@
 import asyncio
 from pathlib import Path
 import sys
+import subprocess
 import click
 
 from agent.agent import Agent
@@ -79,23 +80,31 @@ class CLI:
         assistant_streaming = False
         final_response: str | None = None
 
+        # Bound once: compared against every event, text deltas included
+        text_delta = AgentEventType.TEXT_DELTA
+        text_complete = AgentEventType.TEXT_COMPLETE
+        agent_error = AgentEventType.AGENT_ERROR
+        tool_call_start = AgentEventType.TOOL_CALL_START
+        tool_call_complete = AgentEventType.TOOL_CALL_COMPLETE
+
         async for event in self.agent.run(message):
-            if event.type == AgentEventType.TEXT_DELTA:
-                content = event.data.get("content", "")
+            event_type = event.type
+            if event_type is text_delta:
+                content = event.data["content"]
                 if not assistant_streaming:
                     self.tui.begin_assistant()
                     assistant_streaming = True
                 self.tui.stream_assistant_delta(content)
-            elif event.type == AgentEventType.TEXT_COMPLETE:
+            elif event_type is text_complete:
                 final_response = event.data.get("content")
                 if assistant_streaming:
                     self.tui.end_assistant()
                     assistant_streaming = False
-            elif event.type == AgentEventType.AGENT_ERROR:
-                error = event.data.get("error", "Unknown error")
+            elif event_type is agent_error:
+                error = event.data["error"] or "Unknown error"
                 console.print(f"\n[error]Error: {error}[/error]")
-            elif event.type == AgentEventType.TOOL_CALL_START:
-                tool_name = event.data.get("name", "unknown")
+            elif event_type is tool_call_start:
+                tool_name = event.data["name"] or "unknown"
                 tool_kind = self._get_tool_kind(tool_name)
                 self.tui.tool_call_start(
                     event.data.get("call_id", ""),
@@ -103,8 +112,8 @@ class CLI:
                     tool_kind,
                     event.data.get("arguments", {}),
                 )
-            elif event.type == AgentEventType.TOOL_CALL_COMPLETE:
-                tool_name = event.data.get("name", "unknown")
+            elif event_type is tool_call_complete:
+                tool_name = event.data["name"] or "unknown"
                 tool_kind = self._get_tool_kind(tool_name)
                 self.tui.tool_call_complete(
                     event.data.get("call_id", ""),
@@ -366,26 +375,13 @@ Please use the 'workflow_orchestrator' tool to manage the workflow and proceed t
             return
 
         # Try to get repo from current directory
-        import subprocess
-        try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=self.config.cwd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            url = result.stdout.strip()
-            # Parse to get owner/repo
-            if "github.com" in url:
-                parts = url.replace(".git", "").split("github.com/")[-1].split("/")
-                if len(parts) >= 2:
-                    owner, repo = parts[0], parts[1]
-                    issue_url = f"https://github.com/{owner}/{repo}/issues/{issue_num}"
-                    await self._handle_oss_fix(issue_url)
-                    return
-        except Exception:
-            pass
+        from oss.git_client import get_github_repo
+        repo_info = get_github_repo(self.config.cwd)
+        if repo_info:
+            owner, repo = repo_info
+            issue_url = f"https://github.com/{owner}/{repo}/issues/{issue_num}"
+            await self._handle_oss_fix(issue_url)
+            return
 
         console.print(f"[error]Could not determine repository. Please provide full issue URL.[/error]")
 
@@ -437,7 +433,6 @@ Continue from where we left off."""
             console.print(f"  PR: {phase_info['pr_url']}")
         
         # Show git status if in repo
-        import subprocess
         try:
             result = subprocess.run(
                 ["git", "status", "--short"],
@@ -537,7 +532,6 @@ def interactive(ctx: click.Context, cwd: Path | None):
 # Add OSS command group
 # Fixed missing import for OSS commands
 from cli.oss_commands import oss_dev_group
-from cli.oss_commands import oss_dev_group
 main.add_command(oss_dev_group)
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+"""
+Git Helpers
+
+Repository lookups that avoid spawning git where possible: the GitHub
+origin is read from .git/config and cached, and repeated object/ref
+lookups go through one long-lived `git cat-file --batch-check` process.
+"""
+
+import logging
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_ORIGIN_URL_RE = re.compile(
+    r'^\[remote "origin"\][^\[]*?^\s*url\s*=\s*([^\n]+)$',
+    re.MULTILINE | re.DOTALL,
+)
+# [include]/[includeIf] sections and insteadOf/pushInsteadOf rewrites make the
+# literal url in .git/config unreliable
+_CONFIG_INDIRECTION_RE = re.compile(r"^\s*\[include|insteadof\s*=", re.IGNORECASE | re.MULTILINE)
+# owner/repo from https://github.com/owner/repo(.git) and git@github.com:owner/repo(.git)
+_GH_URL_RE = re.compile(r"github\.com[:/]([^/]+)/([^/\s]+?)(?:\.git)?/?$")
+
+# (owner, repo) per resolved directory. Misses aren't cached so a remote
+# added later in the process is still picked up.
+_GITHUB_REPO_CACHE: dict[str, tuple[str, str]] = {}
+
+
+def _git_env() -> dict[str, str]:
+    """
+    Environment for the git calls below.
+
+    The C locale skips git's locale setup and message translation. Built per
+    call so changes to os.environ (e.g. GIT_DIR or HOME in tests) are seen.
+    """
+    return {**os.environ, "LC_ALL": "C"}
+
+
+def run_git(args: list[str], cwd: Path) -> str:
+    """
+    Run a one-shot git command and return its stdout.
+
+    Output is captured as bytes and decoded once; stderr is discarded.
+
+    Raises:
+        subprocess.CalledProcessError: git exited with a non-zero status
+        FileNotFoundError: git is not installed
+    """
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_git_env(),
+        check=True,
+    )
+    return result.stdout.decode("utf-8", "replace")
+
+
+def start_git(args: list[str], cwd: Path) -> Optional[subprocess.Popen]:
+    """
+    Start a git command without waiting for it.
+
+    Lets the caller overlap git's startup (index read, ref scan) with other
+    work and collect the output later with communicate().
+
+    Returns:
+        The running process, or None if git is not installed or cwd is missing
+    """
+    try:
+        return subprocess.Popen(
+            ["git", *args],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_git_env(),
+        )
+    except OSError:
+        return None
+
+
+def get_github_repo(repository_path: Path) -> Optional[tuple[str, str]]:
+    """
+    Get the GitHub owner and repository name of a directory's origin remote.
+
+    Args:
+        repository_path: Path inside the repository
+
+    Returns:
+        Tuple of (owner, repo) or None if origin is missing or not on GitHub
+    """
+    key = str(Path(repository_path).resolve())
+    repo_info = _GITHUB_REPO_CACHE.get(key)
+    if repo_info is None:
+        url = get_origin_url(Path(key))
+        repo_info = parse_github_url(url) if url else None
+        if repo_info is None and url:
+            # The literal URL may be shorthand for a rewrite in the global or
+            # system config (e.g. "gh:owner/repo"), which only git applies
+            url = _git_origin_url(Path(key))
+            repo_info = parse_github_url(url) if url else None
+        if repo_info is not None:
+            _GITHUB_REPO_CACHE[key] = repo_info
+    return repo_info
+
+
+def parse_github_url(url: str) -> Optional[tuple[str, str]]:
+    """Parse (owner, repo) from an HTTPS or SSH GitHub remote URL."""
+    match = _GH_URL_RE.search(url.strip())
+    return (match.group(1), match.group(2)) if match else None
+
+
+def get_origin_url(repository_path: Path) -> Optional[str]:
+    """
+    Get the origin remote URL.
+
+    Reads .git/config directly. `git remote get-url` is used instead when
+    that finds nothing (worktrees) or when the file has includes or URL
+    rewrites, since those can change the URL git actually uses. Rewrites
+    defined only in the global or system config are not seen here.
+    """
+    try:
+        config_text = (repository_path / ".git" / "config").read_text(encoding="utf-8")
+    except OSError:
+        config_text = ""
+
+    if not _CONFIG_INDIRECTION_RE.search(config_text):
+        match = _ORIGIN_URL_RE.search(config_text)
+        if match:
+            return match.group(1).strip()
+
+    return _git_origin_url(repository_path)
+
+
+def _git_origin_url(repository_path: Path) -> Optional[str]:
+    """Get the origin URL from git, with includes and URL rewrites applied."""
+    try:
+        return run_git(["remote", "get-url", "origin"], repository_path).strip() or None
+    except Exception:
+        return None
+
+
+class GitClient:
+    """
+    Resolves git revisions through a single `git cat-file --batch-check` pipe.
+
+    The process is started on the first lookup and stays alive until close().
+    Use as a context manager around a batch of lookups.
+    """
+
+    def __init__(self, repository_path: Path):
+        """
+        Initialize git client.
+
+        Args:
+            repository_path: Path to the repository
+        """
+        self.repository_path = Path(repository_path)
+        self._proc: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "GitClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=self.repository_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=_git_env(),
+                text=True,
+            )
+        return self._proc
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """
+        Resolve a revision to its object name.
+
+        Args:
+            ref: Any revision git understands (e.g. "refs/heads/main", "HEAD:README.md")
+
+        Returns:
+            The object id, or None if the revision does not exist
+        """
+        # The protocol is line based; a newline would split the request
+        if not ref or "\n" in ref:
+            return None
+
+        proc = self._get_process()
+        proc.stdin.write(f"{ref}\n")
+        proc.stdin.flush()
+        line = proc.stdout.readline()
+        if not line:
+            raise OSError("git cat-file exited unexpectedly")
+
+        # "<oid> <type> <size>" on success, "<ref> missing" / "<ref> ambiguous" otherwise
+        parts = line.split()
+        if len(parts) == 3 and parts[-1].isdigit():
+            return parts[0]
+        return None
+
+    def close(self) -> None:
+        """Stop the git process."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except Exception as e:
+            logger.debug(f"Error closing git process: {e}")
+            self._proc.kill()
+        finally:
+            self._proc = None
@@ -1,25 +1,205 @@
 """
 GitHub API Integration
 
-Provides GitHub API client functionality using GitHub CLI (gh) as primary method,
-with fallback to GitHub API when needed.
+Provides a GitHub REST API client. Requests share one pooled HTTP client,
+authenticated with the configured GitHub token or, failing that, the token
+of the GitHub CLI (gh). Issue reads are cached on disk and revalidated with
+their ETag once stale.
 """
 
+import asyncio
 import json
+import os
 import re
 import subprocess
+import tempfile
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from urllib.parse import urlparse
 
+import httpx
+
 from config.config import Config
+from config.loader import get_data_dir
+
+# Pattern: https://github.com/owner/repo/issues/123
+_ISSUE_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)/issues/(\d+)")
+
+_API_URL = "https://api.github.com"
+_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+_PER_PAGE = 100
+# Cap on concurrent requests from the bulk methods, to stay clear of
+# GitHub's secondary rate limits
+_MAX_CONCURRENT_REQUESTS = 10
+
+# How long a cached response is served without asking GitHub again; after
+# that it is revalidated with its ETag, and a 304 costs no rate limit
+_ISSUE_CACHE_TTL = 600
+# Stale entries are kept this long for revalidation before being dropped
+_ISSUE_CACHE_RETENTION = 86400
+
+# One pooled client per event loop, shared by every GitHubClient: tools
+# create a client per call, and the CLI runs all of them on one loop, so
+# connections (and their TLS sessions) are reused across calls
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_HTTP_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop."""
+    global _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+
+    loop = asyncio.get_running_loop()
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed or _HTTP_CLIENT_LOOP is not loop:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            base_url=_API_URL,
+            headers=_API_HEADERS,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        _HTTP_CLIENT_LOOP = loop
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was opened on the running loop."""
+    global _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+
+    if _HTTP_CLIENT is not None and _HTTP_CLIENT_LOOP is asyncio.get_running_loop():
+        await _HTTP_CLIENT.aclose()
+    _HTTP_CLIENT = None
+    _HTTP_CLIENT_LOOP = None
+
+
+@lru_cache(maxsize=1)
+def _gh_auth_token() -> Optional[str]:
+    """Get the GitHub CLI's token, asked for once per process."""
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout.strip() or None
+
+
+class _IssueCache:
+    """
+    On-disk cache of issue responses, with the ETag each was served with.
+
+    Entries map a key to (expires_at, etag, data). The file is read on first
+    use. Updates stay in memory until save(), which replaces the file
+    atomically so readers in other processes never see a partial write.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or get_data_dir() / "cache" / "github" / "issues.json"
+        self._entries: Optional[dict[str, tuple[float, Optional[str], Any]]] = None
+        self._dirty = False
+        # Snapshots are numbered so a slow write can't replace a newer one
+        self._version = 0
+        self._written_version = 0
+        self._write_lock = threading.Lock()
+
+    def _load(self) -> dict[str, tuple[float, Optional[str], Any]]:
+        if self._entries is None:
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+                self._entries = {key: tuple(entry) for key, entry in raw.items()}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> Optional[tuple[float, Optional[str], Any]]:
+        return self._load().get(key)
+
+    def set(self, key: str, etag: Optional[str], data: Any, ttl: float) -> None:
+        entries = self._load()
+        now = time.time()
+        entries[key] = (now + ttl, etag, data)
+        for stale_key in [
+            k for k, (expires_at, _, _) in entries.items()
+            if expires_at + _ISSUE_CACHE_RETENTION < now
+        ]:
+            del entries[stale_key]
+        self._dirty = True
+
+    def refresh(self, key: str, ttl: float) -> None:
+        """
+        Extend an entry GitHub revalidated with a 304.
+
+        Only expires_at changes, so the file isn't rewritten: another process
+        reading the older expiry just revalidates once more, which is free.
+        """
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is not None:
+            entries[key] = (time.time() + ttl, entry[1], entry[2])
+
+    async def save(self) -> None:
+        """Write pending updates to disk without blocking the event loop."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._version += 1
+        # Serialized here so the thread never iterates entries being updated
+        await asyncio.to_thread(self._write, json.dumps(self._entries), self._version)
+
+    def _write(self, text: str, version: int) -> None:
+        with self._write_lock:
+            if version <= self._written_version:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(text)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                self._written_version = version
+            except OSError:
+                pass
+
+
+_ISSUE_CACHE = _IssueCache()
+
+
+def _error_message(response: httpx.Response) -> str:
+    """Describe a failed API response, including GitHub's error details."""
+    try:
+        data = response.json()
+    except ValueError:
+        return f"HTTP {response.status_code}: {response.text[:200]}"
+
+    message = data.get("message", "") if isinstance(data, dict) else ""
+    details = [
+        error.get("message", "")
+        for error in (data.get("errors") or [] if isinstance(data, dict) else [])
+        if isinstance(error, dict)
+    ]
+    return f"HTTP {response.status_code}: {'; '.join(filter(None, [message, *details]))}"
 
 
 class GitHubClient:
     """
-    GitHub API client using GitHub CLI (gh) as primary method.
+    GitHub REST API client.
 
-    Falls back to direct API calls if GitHub CLI is not available.
+    Uses config.github_token (GITHUB_TOKEN) when set, otherwise the token
+    the GitHub CLI is logged in with.
     """
 
     def __init__(self, config: Config):
@@ -30,19 +210,113 @@ class GitHubClient:
             config: Agent configuration
         """
         self.config = config
-        self._gh_available = self._check_gh_available()
 
-    def _check_gh_available(self) -> bool:
-        """Check if GitHub CLI is available."""
+    def _get_token(self) -> str:
+        """Get the token for API requests."""
+        token = self.config.github_token or _gh_auth_token()
+        if not token:
+            raise RuntimeError(
+                "GitHub token required. Set GITHUB_TOKEN environment variable "
+                "or log in with the GitHub CLI: gh auth login"
+            )
+        return token
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json_body: Optional[dict[str, Any]] = None,
+        etag: Optional[str] = None,
+    ) -> httpx.Response:
+        """
+        Send an authenticated API request.
+
+        Args:
+            etag: Sent as If-None-Match, so an unchanged resource gets a 304
+
+        Raises:
+            RuntimeError: No token is available or the request could not be sent
+        """
+        headers = {"Authorization": f"Bearer {self._get_token()}"}
+        if etag:
+            headers["If-None-Match"] = etag
         try:
-            subprocess.run(
-                ["gh", "--version"],
-                capture_output=True,
-                check=True,
+            return await _get_http_client().request(
+                method, url, params=params, json=json_body, headers=headers
             )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"GitHub API request failed: {e}") from e
+
+    async def _get_cached(
+        self,
+        key: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        project: Callable[[Any], Any],
+        save_cache: bool = True,
+    ) -> Any:
+        """
+        GET a resource through the issue cache.
+
+        A fresh entry is returned without a request. A stale one is
+        revalidated with its ETag and reused when GitHub answers 304.
+
+        Args:
+            key: Cache key
+            url: API path
+            params: Query parameters
+            project: Turns the response JSON into the value that is cached
+            save_cache: Write the cache file after a new response; bulk
+                callers pass False and save once at the end
+
+        Returns:
+            The projected response
+        """
+        cached = _ISSUE_CACHE.get(key)
+        if cached is not None and cached[0] > time.time():
+            return cached[2]
+
+        response = await self._request(
+            "GET", url, params=params, etag=cached[1] if cached else None
+        )
+        if response.status_code == 304 and cached is not None:
+            _ISSUE_CACHE.refresh(key, _ISSUE_CACHE_TTL)
+            return cached[2]
+        if response.is_error:
+            raise RuntimeError(_error_message(response))
+
+        data = project(response.json())
+        _ISSUE_CACHE.set(key, response.headers.get("ETag"), data, _ISSUE_CACHE_TTL)
+        if save_cache:
+            await _ISSUE_CACHE.save()
+        return data
+
+    async def _get_pages(
+        self, url: str, params: dict[str, Any], limit: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """
+        GET a list endpoint, following pagination links.
+
+        Args:
+            url: API path
+            params: Query parameters for the first page
+            limit: Stop once this many items are collected
+
+        Returns:
+            Items from all pages (at most limit)
+        """
+        items: list[dict[str, Any]] = []
+        next_url: Optional[str] = url
+        while next_url and (limit is None or len(items) < limit):
+            response = await self._request("GET", next_url, params=params)
+            if response.is_error:
+                raise RuntimeError(_error_message(response))
+            items.extend(response.json())
+            # The next link already carries the query string
+            next_url = response.links.get("next", {}).get("url")
+            params = None
+        return items if limit is None else items[:limit]
 
     def parse_issue_url(self, issue_url: str) -> dict[str, Any]:
         """
@@ -54,17 +328,16 @@ class GitHubClient:
         Returns:
             Dictionary with owner, repo, and issue_number
         """
-        # Pattern: https://github.com/owner/repo/issues/123
-        pattern = r"github\.com/([^/]+)/([^/]+)/issues/(\d+)"
-        match = re.search(pattern, issue_url)
+        match = _ISSUE_URL_RE.search(issue_url)
 
         if not match:
             raise ValueError(f"Invalid GitHub issue URL: {issue_url}. Ensure it follows the format: https://github.com/owner/repo/issues/number. Refer to GitHub documentation for help.")
 
+        owner, repo, issue_number = match.groups()
         return {
-            "owner": match.group(1),
-            "repo": match.group(2),
-            "issue_number": int(match.group(3)),
+            "owner": owner,
+            "repo": repo,
+            "issue_number": int(issue_number),
         }
 
     async def fetch_issue(
@@ -80,90 +353,63 @@ class GitHubClient:
         Returns:
             Issue data dictionary
         """
-        if not issue_number:
-            parsed = self.parse_issue_url(issue_url)
-            issue_number = parsed["issue_number"]
-            owner = parsed["owner"]
-            repo = parsed["repo"]
-        else:
-            parsed = self.parse_issue_url(issue_url)
-            owner = parsed["owner"]
-            repo = parsed["repo"]
-
-        if self._gh_available:
-            return await self._fetch_issue_via_gh(owner, repo, issue_number)
-        else:
-            return await self._fetch_issue_via_api(owner, repo, issue_number)
-
-    async def _fetch_issue_via_gh(
-        self, owner: str, repo: str, issue_number: int
-    ) -> dict[str, Any]:
+        parsed = self.parse_issue_url(issue_url)
+        return await self._fetch_issue(
+            parsed["owner"], parsed["repo"], issue_number or parsed["issue_number"]
+        )
+
+    async def fetch_issues_bulk(self, issue_urls: list[str]) -> list[dict[str, Any]]:
         """
-        Fetch issue using GitHub CLI.
+        Fetch several issues concurrently.
+
+        At most _MAX_CONCURRENT_REQUESTS requests are in flight at once, and
+        the issue cache is written once after all of them.
 
         Args:
-            owner: Repository owner
-            repo: Repository name
-            issue_number: Issue number
+            issue_urls: GitHub issue URLs
 
         Returns:
-            Issue data dictionary
+            Issue data dictionaries, in the order of issue_urls
         """
-        try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    f"repos/{owner}/{repo}/issues/{issue_number}",
-                    "--jq",
-                    "{title: .title, body: .body, state: .state, labels: [.labels[].name], number: .number}",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        # Parsed up front so an invalid URL fails before any request is sent
+        parsed_urls = [self.parse_issue_url(url) for url in issue_urls]
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(parsed: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_issue(
+                    parsed["owner"], parsed["repo"], parsed["issue_number"], save_cache=False
+                )
 
-            issue_data = json.loads(result.stdout)
+        try:
+            return await asyncio.gather(*(fetch(parsed) for parsed in parsed_urls))
+        finally:
+            await _ISSUE_CACHE.save()
 
+    async def _fetch_issue(
+        self, owner: str, repo: str, issue_number: int, save_cache: bool = True
+    ) -> dict[str, Any]:
+        """Fetch one issue through the REST API."""
+        def project(issue_data: dict[str, Any]) -> dict[str, Any]:
             return {
                 "title": issue_data.get("title", ""),
-                "body": issue_data.get("body", ""),
+                "body": issue_data.get("body") or "",
                 "state": issue_data.get("state", "open"),
-                "labels": issue_data.get("labels", []),
+                "labels": [label["name"] for label in issue_data.get("labels", [])],
                 "number": issue_data.get("number", issue_number),
                 "url": f"https://github.com/{owner}/{repo}/issues/{issue_number}",
             }
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            raise RuntimeError(f"Failed to fetch issue via GitHub CLI: {e}. This might be due to authentication issues or the CLI may not be installed. Please verify your CLI setup.")
-
-    async def _fetch_issue_via_api(
-        self, owner: str, repo: str, issue_number: int
-    ) -> dict[str, Any]:
-        """
-        Fetch issue using GitHub API directly.
-
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            issue_number: Issue number
 
-        Returns:
-            Issue data dictionary
-        """
-        github_token = self.config.github_token
-        if not github_token:
-            raise RuntimeError(
-                "GitHub token required when GitHub CLI is not available. "
-                "Set GITHUB_TOKEN environment variable or install GitHub CLI (gh)."
+        try:
+            return await self._get_cached(
+                f"issue:{owner}/{repo}/{issue_number}",
+                f"/repos/{owner}/{repo}/issues/{issue_number}",
+                None,
+                project,
+                save_cache=save_cache,
             )
-
-        # This would use httpx or requests to call GitHub API
-        # For now, raise an error to encourage using GitHub CLI
-        # Placeholder for future API calls to GitHub.
-        raise NotImplementedError(
-            "Direct GitHub API calls not yet implemented. "
-            "Please install GitHub CLI: sudo apt install gh && gh auth login"
-        )
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to fetch issue via GitHub API: {e}")
 
     async def create_pr(
         self,
@@ -177,6 +423,8 @@ class GitHubClient:
         """
         Create a pull request.
 
+        If a PR for the same head and base already exists, that PR is returned.
+
         Args:
             owner: Repository owner
             repo: Repository name
@@ -188,113 +436,56 @@ class GitHubClient:
         Returns:
             PR data dictionary with URL
         """
-        if self._gh_available:
-            return await self._create_pr_via_gh(owner, repo, title, body, head, base)
-        else:
-            return await self._create_pr_via_api(owner, repo, title, body, head, base)
-
-    async def _create_pr_via_gh(
-        self,
-        owner: str,
-        repo: str,
-        title: str,
-        body: str,
-        head: str,
-        base: str,
-    ) -> dict[str, Any]:
-        """Create PR using GitHub CLI."""
         try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "create",
-                    "--repo",
-                    f"{owner}/{repo}",
-                    "--title",
-                    title,
-                    "--body",
-                    body,
-                    "--head",
-                    head,
-                    "--base",
-                    base,
-                    "--json",
-                    "url,number,title",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
+            response = await self._request(
+                "POST",
+                f"/repos/{owner}/{repo}/pulls",
+                json_body={"title": title, "body": body, "head": head, "base": base},
             )
-
-            import json
-            pr_data = json.loads(result.stdout)
-
-            return {
-                "url": pr_data.get("url", ""),
-                "number": pr_data.get("number", 0),
-                "title": pr_data.get("title", title),
-            }
-        except subprocess.CalledProcessError as e:
-            error_output = e.stderr or e.stdout or ""
-            # Check if PR already exists
-            if "already exists" in error_output.lower() or "pull request already exists" in error_output.lower():
-                # Try to get existing PR
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to create PR via GitHub API: {e}")
+        if response.is_error:
+            error = _error_message(response)
+            if response.status_code == 422 and "already exists" in error.lower():
+                # The head filter needs the "owner:branch" form
                 try:
-                    result = subprocess.run(
-                        [
-                            "gh",
-                            "pr",
-                            "list",
-                            "--repo",
-                            f"{owner}/{repo}",
-                            "--head",
-                            head,
-                            "--base",
-                            base,
-                            "--json",
-                            "url,number,title",
-                            "--limit",
-                            "1",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        check=True,
+                    existing = await self._get_pages(
+                        f"/repos/{owner}/{repo}/pulls",
+                        {
+                            "head": head if ":" in head else f"{owner}:{head}",
+                            "base": base,
+                            "state": "open",
+                            "per_page": 1,
+                        },
+                        limit=1,
                     )
-                    pr_list = json.loads(result.stdout)
-                    if pr_list:
-                        existing_pr = pr_list[0]
-                        return {
-                            "url": existing_pr.get("url", ""),
-                            "number": existing_pr.get("number", 0),
-                            "title": existing_pr.get("title", title),
-                        }
-                except Exception:
-                    pass
-            raise RuntimeError(f"Failed to create PR via GitHub CLI: {e}. Make sure the repository exists and that you have appropriate permissions to access it.")
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse PR creation response: {e}")
-
-    async def _create_pr_via_api(
-        self,
-        owner: str,
-        repo: str,
-        title: str,
-        body: str,
-        head: str,
-        base: str,
-    ) -> dict[str, Any]:
-        """Create PR using GitHub API directly."""
-        # Placeholder for future API calls to GitHub.
-        raise NotImplementedError(
-            "Direct GitHub API calls not yet implemented. "
-            "Please install GitHub CLI: sudo apt install gh && gh auth login"
-        )
+                except RuntimeError:
+                    existing = []
+                if existing:
+                    pr_data = existing[0]
+                    return {
+                        "url": pr_data.get("html_url", ""),
+                        "number": pr_data.get("number", 0),
+                        "title": pr_data.get("title", title),
+                    }
+            raise RuntimeError(
+                f"Failed to create PR via GitHub API: {error}. Make sure the repository "
+                "exists and that you have appropriate permissions to access it."
+            )
+
+        pr_data = response.json()
+        return {
+            "url": pr_data.get("html_url", ""),
+            "number": pr_data.get("number", 0),
+            "title": pr_data.get("title", title),
+        }
 
     def get_pr_status(self, owner: str, repo: str, pr_number: int) -> dict[str, Any]:
         """
         Get PR status.
 
+        Uses the GitHub CLI, which resolves the review decision in one call.
+
         Args:
             owner: Repository owner
             repo: Repository name
@@ -303,30 +494,26 @@ class GitHubClient:
         Returns:
             PR status dictionary
         """
-        if self._gh_available:
-            try:
-                result = subprocess.run(
-                    [
-                        "gh",
-                        "pr",
-                        "view",
-                        str(pr_number),
-                        "--repo",
-                        f"{owner}/{repo}",
-                        "--json",
-                        "state,isDraft,reviewDecision,url",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
-                import json
-                return json.loads(result.stdout)
-            except (subprocess.CalledProcessError, json.JSONDecodeError):
-                return {"state": "unknown"}
+        try:
+            result = subprocess.run(
+                [
+                    "gh",
+                    "pr",
+                    "view",
+                    str(pr_number),
+                    "--repo",
+                    f"{owner}/{repo}",
+                    "--json",
+                    "state,isDraft,reviewDecision,url",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
 
-        return {"state": "unknown"}
+            return json.loads(result.stdout)
+        except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
+            return {"state": "unknown"}
 
     async def list_issues(
         self,
@@ -347,50 +534,30 @@ class GitHubClient:
         Returns:
             List of issue dictionaries
         """
-        if self._gh_available:
-            return await self._list_issues_via_gh(owner, repo, state, limit)
-        else:
-            return await self._list_issues_via_api(owner, repo, state, limit)
-
-    async def _list_issues_via_gh(
-        self, owner: str, repo: str, state: str, limit: int
-    ) -> list[dict[str, Any]]:
-        """List issues using GitHub CLI."""
+        def project(issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return [
+                {
+                    "title": issue.get("title", ""),
+                    "number": issue.get("number"),
+                    "state": issue.get("state"),
+                    "labels": [label["name"] for label in issue.get("labels", [])],
+                    "url": issue.get("html_url"),
+                }
+                for issue in issues[:limit]
+            ]
+
+        url = f"/repos/{owner}/{repo}/issues"
+        params = {"state": state, "per_page": min(limit, _PER_PAGE)}
         try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    f"repos/{owner}/{repo}/issues",
-                    "--jq",
-                    f".[:{limit}] | .[] | {{title: .title, number: .number, state: .state, labels: [.labels[].name], url: .html_url}}",
-                    "--paginate",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            import json
-            # Parse line-delimited JSON
-            issues = []
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    issues.append(json.loads(line))
-            return issues[:limit]
-
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            raise RuntimeError(f"Failed to list issues via GitHub CLI: {e}. This may be related to network connectivity or GitHub CLI authentication issues.")
-
-    async def _list_issues_via_api(
-        self, owner: str, repo: str, state: str, limit: int
-    ) -> list[dict[str, Any]]:
-        """List issues using GitHub API directly."""
-        # Placeholder for future API calls to GitHub.
-        raise NotImplementedError(
-            "Direct GitHub API calls not yet implemented. "
-            "Please install GitHub CLI: sudo apt install gh && gh auth login"
-        )
+            # A single page has one ETag to revalidate with; longer listings
+            # aren't cached
+            if limit <= _PER_PAGE:
+                return await self._get_cached(
+                    f"issues:{owner}/{repo}/{state}/{limit}", url, params, project
+                )
+            return project(await self._get_pages(url, params, limit=limit))
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to list issues via GitHub API: {e}")
 
     async def get_pr_comments(
         self, owner: str, repo: str, pr_number: int
@@ -406,45 +573,44 @@ class GitHubClient:
         Returns:
             List of comment dictionaries
         """
-        if self._gh_available:
-            return await self._get_pr_comments_via_gh(owner, repo, pr_number)
-        else:
-            return await self._get_pr_comments_via_api(owner, repo, pr_number)
-
-    async def _get_pr_comments_via_gh(
-        self, owner: str, repo: str, pr_number: int
-    ) -> list[dict[str, Any]]:
-        """Get PR comments using GitHub CLI."""
         try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    f"repos/{owner}/{repo}/pulls/{pr_number}/comments",
-                    "--jq",
-                    ".[] | {body: .body, user: .user.login, created_at: .created_at}",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
+            comments = await self._get_pages(
+                f"/repos/{owner}/{repo}/pulls/{pr_number}/comments",
+                {"per_page": _PER_PAGE},
             )
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to get PR comments via GitHub API: {e}")
+
+        return [
+            {
+                "body": comment.get("body"),
+                "user": (comment.get("user") or {}).get("login"),
+                "created_at": comment.get("created_at"),
+            }
+            for comment in comments
+        ]
+
+    async def get_pr_comments_bulk(
+        self, owner: str, repo: str, pr_numbers: list[int]
+    ) -> dict[int, list[dict[str, Any]]]:
+        """
+        Get the comments of several PRs concurrently.
 
-            import json
-            comments = []
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    comments.append(json.loads(line))
-            return comments
+        At most _MAX_CONCURRENT_REQUESTS requests are in flight at once.
 
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            raise RuntimeError(f"Failed to get PR comments via GitHub CLI: {e}. Please check your internet connection and ensure that the CLI is properly authenticated.")
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pr_numbers: PR numbers
 
-    async def _get_pr_comments_via_api(
-        self, owner: str, repo: str, pr_number: int
-    ) -> list[dict[str, Any]]:
-        """Get PR comments using GitHub API directly."""
-        # Placeholder for future API calls to GitHub.
-        raise NotImplementedError(
-            "Direct GitHub API calls not yet implemented. "
-            "Please install GitHub CLI: sudo apt install gh && gh auth login"
-        )
+        Returns:
+            Comment lists keyed by PR number
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+        async def get_comments(pr_number: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.get_pr_comments(owner, repo, pr_number)
+
+        results = await asyncio.gather(*(get_comments(number) for number in pr_numbers))
+        return dict(zip(pr_numbers, results))
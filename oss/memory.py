@@ -6,6 +6,7 @@ enabling workflow resumption and branch switching.
 """
 
 import json
+import subprocess
 from pathlib import Path
 from typing import Any, Optional
 from dataclasses import dataclass, asdict
@@ -13,10 +14,30 @@ from datetime import datetime
 
 from typing import TYPE_CHECKING
 
+from oss.git_client import GitClient
+
+try:
+    import orjson
+except ImportError:  # optional, json is used when it isn't installed
+    orjson = None
+
 if TYPE_CHECKING:
     from oss.workflow import WorkflowState
 
 
+def _read_json(path: Path) -> Any:
+    """
+    Read and parse a memory file.
+
+    Uses orjson when installed; its decode error subclasses
+    json.JSONDecodeError, so callers catch one exception type either way.
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 @dataclass
 class BranchMemoryData:
     """Branch memory data structure"""
@@ -73,8 +94,15 @@ class BranchMemoryManager:
         Returns:
             Branch name or None if not in git repo
         """
+        # Fast path: read .git/HEAD directly instead of spawning git
+        try:
+            head = (self.repository_path / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+            if head.startswith("ref: refs/heads/"):
+                return head[len("ref: refs/heads/"):]
+        except OSError:
+            pass
+
         try:
-            import subprocess
             result = subprocess.run(
                 ["git", "rev-parse", "--abbrev-ref", "HEAD"],
                 cwd=self.repository_path,
@@ -114,8 +142,7 @@ class BranchMemoryManager:
             return None
 
         try:
-            content = memory_file.read_text(encoding="utf-8")
-            return json.loads(content)
+            return _read_json(memory_file)
         except (json.JSONDecodeError, IOError):
             return None
 
@@ -214,14 +241,56 @@ class BranchMemoryManager:
         branches = []
         for memory_file in self.memory_dir.glob("*.json"):
             try:
-                content = memory_file.read_text(encoding="utf-8")
-                data = json.loads(content)
+                data = _read_json(memory_file)
                 branches.append(data)
             except (json.JSONDecodeError, IOError):
                 continue
 
         return branches
 
+    def find_branch_for_issue(self, issue_number: int) -> Optional[str]:
+        """
+        Find the branch whose memory belongs to an issue.
+
+        Stops reading memory files at the first match.
+
+        Args:
+            issue_number: GitHub issue number
+
+        Returns:
+            Branch name or None if no branch memory references the issue
+        """
+        for memory_file in self.memory_dir.glob("*.json"):
+            try:
+                data = _read_json(memory_file)
+            except (json.JSONDecodeError, IOError):
+                continue
+            if data.get("issue_number") == issue_number:
+                return data.get("branch_name")
+
+        return None
+
+    def list_branches_with_summaries(self) -> list[dict[str, Any]]:
+        """
+        List all branches with memory, as branch summaries.
+
+        Reads each memory file once, instead of list_branches() followed by
+        get_branch_summary() per branch.
+
+        Returns:
+            List of summary dictionaries (see get_branch_summary)
+        """
+        summaries = []
+        for data in self.list_branches():
+            try:
+                memory = BranchMemoryData(**data)
+            except TypeError:
+                # Skip files that don't match the memory schema
+                continue
+            summaries.append(self._build_summary(memory))
+
+        return summaries
+
     def summarize_context(self, branch_name: str, max_length: int = 500) -> str:
         """
         Create a compact summary of work done on a branch.
@@ -237,8 +306,10 @@ class BranchMemoryManager:
         if not memory_data:
             return ""
 
-        memory = BranchMemoryData(**memory_data)
-        
+        return self._summarize_memory(BranchMemoryData(**memory_data), max_length)
+
+    def _summarize_memory(self, memory: BranchMemoryData, max_length: int = 500) -> str:
+        """Build the compact work summary for already loaded branch memory."""
         summary_parts = []
         
         if memory.issue_number:
@@ -374,23 +445,24 @@ class BranchMemoryManager:
         cutoff_date = datetime.now() - timedelta(days=days_old)
         cleaned = 0
         
-        for memory_file in self.memory_dir.glob("*.json"):
-            try:
-                content = memory_file.read_text(encoding="utf-8")
-                data = json.loads(content)
-                
-                updated_at_str = data.get("updated_at")
-                if updated_at_str:
-                    updated_at = datetime.fromisoformat(updated_at_str)
-                    if updated_at < cutoff_date:
-                        # Check if branch still exists
-                        branch_name = data.get("branch_name", "")
-                        if not self._branch_exists(branch_name):
-                            memory_file.unlink()
-                            cleaned += 1
-            except (json.JSONDecodeError, IOError, ValueError):
-                # Skip invalid files
-                continue
+        # One git process answers the branch checks for every memory file
+        with GitClient(self.repository_path) as git:
+            for memory_file in self.memory_dir.glob("*.json"):
+                try:
+                    data = _read_json(memory_file)
+                    
+                    updated_at_str = data.get("updated_at")
+                    if updated_at_str:
+                        updated_at = datetime.fromisoformat(updated_at_str)
+                        if updated_at < cutoff_date:
+                            # Check if branch still exists
+                            branch_name = data.get("branch_name", "")
+                            if not self._branch_exists(branch_name, git):
+                                memory_file.unlink()
+                                cleaned += 1
+                except (json.JSONDecodeError, IOError, ValueError):
+                    # Skip invalid files
+                    continue
         
         return cleaned
 
@@ -404,37 +476,44 @@ class BranchMemoryManager:
         """
         cleaned = 0
         
-        for memory_file in self.memory_dir.glob("*.json"):
-            try:
-                content = memory_file.read_text(encoding="utf-8")
-                data = json.loads(content)
-                
-                branch_name = data.get("branch_name", "")
-                pr_url = data.get("pr_url")
-                
-                # If PR exists and branch is merged, clean up
-                if pr_url and not self._branch_exists(branch_name):
-                    # Check if PR is merged (would need GitHub API)
-                    # For now, just check if branch exists
-                    memory_file.unlink()
-                    cleaned += 1
-            except (json.JSONDecodeError, IOError):
-                continue
+        with GitClient(self.repository_path) as git:
+            for memory_file in self.memory_dir.glob("*.json"):
+                try:
+                    data = _read_json(memory_file)
+                    
+                    branch_name = data.get("branch_name", "")
+                    pr_url = data.get("pr_url")
+                    
+                    # If PR exists and branch is merged, clean up
+                    if pr_url and not self._branch_exists(branch_name, git):
+                        # Check if PR is merged (would need GitHub API)
+                        # For now, just check if branch exists
+                        memory_file.unlink()
+                        cleaned += 1
+                except (json.JSONDecodeError, IOError):
+                    continue
         
         return cleaned
 
-    def _branch_exists(self, branch_name: str) -> bool:
+    def _branch_exists(self, branch_name: str, git: Optional[GitClient] = None) -> bool:
         """
         Check if a git branch exists.
 
         Args:
             branch_name: Branch name
+            git: Optional persistent git process to answer the lookup
 
         Returns:
             True if branch exists
         """
+        if git is not None:
+            try:
+                return git.resolve(f"refs/heads/{branch_name}") is not None
+            except OSError:
+                # git unavailable or the pipe died - fall back to a one-off call
+                pass
+
         try:
-            import subprocess
             result = subprocess.run(
                 ["git", "branch", "--list", branch_name],
                 cwd=self.repository_path,
@@ -463,8 +542,10 @@ class BranchMemoryManager:
                 "exists": False,
             }
         
-        memory = BranchMemoryData(**memory_data)
-        
+        return self._build_summary(BranchMemoryData(**memory_data))
+
+    def _build_summary(self, memory: BranchMemoryData) -> dict[str, Any]:
+        """Build the get_branch_summary() dictionary for loaded branch memory."""
         return {
             "branch_name": memory.branch_name,
             "issue_number": memory.issue_number,
@@ -474,7 +555,7 @@ class BranchMemoryManager:
             "pr_url": memory.pr_url,
             "files_modified": len(memory.files_modified or []),
             "completed_steps": len(memory.completed_steps or []),
-            "context_summary": memory.context_summary or self.summarize_context(branch_name),
+            "context_summary": memory.context_summary or self._summarize_memory(memory),
             "last_updated": memory.updated_at,
             "exists": True,
         }
@@ -224,8 +224,6 @@ class RepositoryManager:
             package_json = self.repository_path / "package.json"
             if package_json.exists():
                 try:
-                    import json
-
                     data = json.loads(package_json.read_text())
                     if "scripts" in data:
                         for script_name, script_cmd in data["scripts"].items():
@@ -271,8 +269,6 @@ class RepositoryManager:
             package_json = self.repository_path / "package.json"
             if package_json.exists():
                 try:
-                    import json
-
                     data = json.loads(package_json.read_text())
                     if "scripts" in data and "test" in data["scripts"]:
                         test_strategy["Tests"] = data["scripts"]["test"]
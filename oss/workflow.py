@@ -17,6 +17,7 @@ from typing import Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
+import subprocess
 
 from config.config import Config
 from oss.repository import RepositoryManager
@@ -114,7 +115,6 @@ class OSSWorkflow:
             expected_branch = self.config.oss.branch_naming_pattern.format(number=self.state.issue_number)
             # Check if branch exists
             try:
-                import subprocess
                 result = subprocess.run(
                     ["git", "rev-parse", "--verify", f"refs/heads/{expected_branch}"],
                     cwd=self.repository_path,
@@ -267,7 +267,6 @@ class OSSWorkflow:
             return
 
         try:
-            import subprocess
             # Get modified files from git
             result = subprocess.run(
                 ["git", "status", "--porcelain"],
@@ -922,9 +921,6 @@ After PR is successfully created:
         Returns:
             (is_valid, error_message)
         """
-        import subprocess
-        from pathlib import Path
-        
         # Check 1: Branch must be created and we must be on it
         try:
             result = subprocess.run(
@@ -996,7 +992,6 @@ After PR is successfully created:
         # Don't check on every phase transition - only when it matters
         # Check if we're transitioning FROM planning TO implementation
         if previous_phase == WorkflowPhase.PLANNING.value:
-            import subprocess
             try:
                 result = subprocess.run(
                     ["git", "branch", "--show-current"],
@@ -1,5 +1,7 @@
 from datetime import datetime
+import os
 import platform
+import sys
 from config.config import Config
 from tools.base import Tool
 
@@ -76,9 +78,6 @@ The user has granted you access to run tools in service of their request. Use th
 
 def _get_shell_info() -> str:
     """Get shell information based on platform."""
-    import os
-    import sys
-
     if sys.platform == "darwin":
         return os.environ.get("SHELL", "/bin/zsh")
     elif sys.platform == "win32":
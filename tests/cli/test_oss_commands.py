@@ -2,11 +2,27 @@
 Tests for OSS CLI commands.
 """
 
+import asyncio
+import io
+from types import SimpleNamespace
+
 import pytest
 from click.testing import CliRunner
 from pathlib import Path
-
-from cli.oss_commands import oss_dev_group
+from rich.console import Console
+from rich.text import Text
+
+import cli.oss_commands
+from cli.oss_commands import (
+    StreamingPrinter,
+    _collect_repo_state,
+    _start_repo_state,
+    _start_workflow_with_agent,
+    get_repo_from_cwd,
+    oss_dev_group,
+)
+from config.config import Config
+from oss.github import GitHubClient
 
 
 @pytest.fixture
@@ -93,3 +109,121 @@ def test_oss_dev_switch_requires_target(cli_runner):
     result = cli_runner.invoke(oss_dev_group, ["switch"])
     assert result.exit_code != 0
     assert "Missing argument" in result.output or "required" in result.output.lower()
+
+
+def test_get_repo_from_cwd(temp_repo):
+    """Test that owner and repo are read from the origin remote."""
+    assert get_repo_from_cwd(temp_repo) == ("test-owner", "test-repo")
+
+
+def test_get_repo_from_cwd_without_remote(temp_dir):
+    """Test that a directory without a GitHub remote returns None."""
+    assert get_repo_from_cwd(temp_dir) is None
+
+
+def test_get_repo_from_cwd_ssh_remote(mock_git_repo):
+    """Test that owner and repo are parsed from an SSH origin URL."""
+    import subprocess
+    subprocess.run(
+        ["git", "remote", "add", "origin", "git@github.com:ssh-owner/ssh-repo.git"],
+        cwd=mock_git_repo,
+        capture_output=True,
+        check=True,
+    )
+    assert get_repo_from_cwd(mock_git_repo) == ("ssh-owner", "ssh-repo")
+
+
+def test_get_repo_from_cwd_url_rewrite(mock_git_repo):
+    """Test that an insteadOf rewrite in .git/config is applied to origin."""
+    import subprocess
+    for args in (
+        ["remote", "add", "origin", "https://github.com/mirror-owner/repo.git"],
+        ["config", "url.https://github.com/real-owner/.insteadOf", "https://github.com/mirror-owner/"],
+    ):
+        subprocess.run(["git", *args], cwd=mock_git_repo, capture_output=True, check=True)
+    assert get_repo_from_cwd(mock_git_repo) == ("real-owner", "repo")
+
+
+def test_collect_repo_state(mock_git_repo):
+    """Test branch and uncommitted changes parsed from one git status call."""
+    (Path(mock_git_repo) / "new_file.py").write_text("print('hi')\n")
+
+    state = _collect_repo_state(mock_git_repo)
+    assert state is not None
+    assert state.current_branch
+    assert state.uncommitted == ["?? new_file.py"]
+
+
+def test_collect_repo_state_tracked_only(mock_git_repo):
+    """Test untracked files are skipped when status is started tracked-only."""
+    (Path(mock_git_repo) / "new_file.py").write_text("print('hi')\n")
+
+    proc = _start_repo_state(mock_git_repo, untracked=False)
+    state = _collect_repo_state(mock_git_repo, proc)
+    assert state is not None
+    assert state.uncommitted == []
+
+
+def test_collect_repo_state_outside_repo(temp_dir):
+    """Test that a directory outside git returns None."""
+    assert _collect_repo_state(temp_dir) is None
+
+
+def test_streaming_printer_plain_output():
+    """Off-terminal, batches are written as plain text in arrival order."""
+    output = io.StringIO()
+
+    async def stream():
+        printer = StreamingPrinter(Console(file=output, force_terminal=False))
+        printer.write("Hello ")
+        printer.print(Text("Using tool: read_file", style="dim"))
+        printer.print("[error]failed[/error]")
+        printer.write("world")
+        printer.flush()
+
+    asyncio.run(stream())
+    assert output.getvalue() == "Hello Using tool: read_file\nfailed\nworld"
+
+
+def _fake_workflow(start):
+    return SimpleNamespace(github_client=GitHubClient(Config()), start=start)
+
+
+def test_start_workflow_rejects_bad_url_before_agent_setup(monkeypatch):
+    """An invalid issue URL fails before any agent setup starts."""
+    started = []
+
+    async def fake_agent(config):
+        started.append(config)
+
+    async def start(issue_url):
+        raise AssertionError("workflow should not start")
+
+    monkeypatch.setattr(cli.oss_commands, "get_or_create_agent", fake_agent)
+    with pytest.raises(ValueError):
+        asyncio.run(_start_workflow_with_agent(object(), _fake_workflow(start), "https://example.com/x"))
+    assert started == []
+
+
+def test_start_workflow_cancels_agent_setup_on_failure(monkeypatch):
+    """A failed workflow start cancels and awaits the agent setup."""
+    events = []
+
+    async def fake_agent(config):
+        events.append("setup started")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("setup cancelled")
+            raise
+
+    async def start(issue_url):
+        await asyncio.sleep(0)
+        raise RuntimeError("issue fetch failed")
+
+    monkeypatch.setattr(cli.oss_commands, "get_or_create_agent", fake_agent)
+    with pytest.raises(RuntimeError, match="issue fetch failed"):
+        asyncio.run(_start_workflow_with_agent(
+            object(), _fake_workflow(start), "https://github.com/owner/repo/issues/1"
+        ))
+    assert events == ["setup started", "setup cancelled"]
@@ -0,0 +1,129 @@
+"""
+Tests for the chat completion response cache.
+"""
+
+import pytest
+
+from client.llm_client import LLMClient
+from client.response import StreamEvent, StreamEventType, TextDelta, TokenUsage, ToolCall
+from client.response_cache import ResponseCache, ResponseRecorder, replay_response
+from config.config import Config, ModelConfig
+
+
+def _events():
+    return [
+        StreamEvent(type=StreamEventType.TEXT_DELTA, text_delta=TextDelta("Hel")),
+        StreamEvent(type=StreamEventType.TEXT_DELTA, text_delta=TextDelta("lo")),
+        StreamEvent(
+            type=StreamEventType.TOOL_CALL_COMPLETE,
+            tool_call=ToolCall(call_id="call_1", name="read_file", arguments='{"path": "a.py"}'),
+        ),
+        StreamEvent(
+            type=StreamEventType.MESSAGE_COMPLETE,
+            finish_reason="tool_calls",
+            usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        ),
+    ]
+
+
+@pytest.fixture
+def cached_client(temp_dir):
+    """An LLM client with the response cache enabled at temperature 0."""
+    config = Config(
+        cwd=temp_dir,
+        model=ModelConfig(api_key="test-key", temperature=0, response_cache=True),
+    )
+    client = LLMClient(config)
+    client._response_cache = ResponseCache(temp_dir / "responses")
+    return client
+
+
+def test_config_temperature_reads_model_temperature():
+    """Test Config.temperature is the model temperature, not the model name."""
+    config = Config(model=ModelConfig(temperature=0.5))
+    assert config.temperature == 0.5
+
+    config.temperature = 0
+    assert config.model.temperature == 0
+    assert config.model_name == ModelConfig().name
+
+
+def test_make_key_is_order_independent(temp_dir):
+    """Test the cache key depends on request content only."""
+    cache = ResponseCache(temp_dir)
+    request = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0}
+
+    assert cache.make_key(request) == cache.make_key(dict(reversed(request.items())))
+    assert cache.make_key(request) != cache.make_key({**request, "model": "other"})
+
+
+def test_recorder_round_trip(temp_dir):
+    """Test a recorded stream is stored and replayed as the same events."""
+    recorder = ResponseRecorder()
+    for event in _events():
+        recorder.record(event)
+    assert recorder.cacheable
+
+    cache = ResponseCache(temp_dir)
+    cache.set("key", recorder.to_record())
+    replayed = replay_response(cache.get("key"))
+
+    assert [event.type for event in replayed] == [
+        StreamEventType.TEXT_DELTA,
+        StreamEventType.TOOL_CALL_COMPLETE,
+        StreamEventType.MESSAGE_COMPLETE,
+    ]
+    assert replayed[0].text_delta.content == "Hello"
+    assert replayed[1].tool_call.call_id == "call_1"
+    assert replayed[1].tool_call.name == "read_file"
+    assert replayed[1].tool_call.arguments == '{"path": "a.py"}'
+    assert replayed[2].finish_reason == "tool_calls"
+    assert replayed[2].usage == TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+
+
+def test_recorder_skips_failed_responses():
+    """Test a response that ended in an error is not cacheable."""
+    recorder = ResponseRecorder()
+    recorder.record(StreamEvent(type=StreamEventType.TEXT_DELTA, text_delta=TextDelta("partial")))
+    recorder.record(StreamEvent(type=StreamEventType.ERROR, error="boom"))
+    assert not recorder.cacheable
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_replays_streamed_response(cached_client):
+    """Test a second identical streamed request is served from the cache."""
+    calls = []
+
+    async def fake_stream(client, kwargs):
+        calls.append(kwargs)
+        for event in _events():
+            yield event
+
+    cached_client._stream_response = fake_stream
+    messages = [{"role": "user", "content": "hi"}]
+
+    first = [event async for event in cached_client.chat_completion(messages)]
+    second = [event async for event in cached_client.chat_completion(messages)]
+
+    assert len(calls) == 1
+    assert calls[0]["temperature"] == 0
+    assert [event.type for event in first] == [event.type for event in _events()]
+    assert second[1].tool_call.call_id == "call_1"
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_does_not_cache_non_stream(cached_client):
+    """Test non-streamed requests always reach the API."""
+    calls = []
+
+    async def fake_non_stream(client, kwargs):
+        calls.append(kwargs)
+        return StreamEvent(type=StreamEventType.MESSAGE_COMPLETE, text_delta=TextDelta("ok"))
+
+    cached_client._non_stream_response = fake_non_stream
+    messages = [{"role": "user", "content": "hi"}]
+
+    for _ in range(2):
+        events = [event async for event in cached_client.chat_completion(messages, stream=False)]
+        assert events[0].text_delta.content == "ok"
+    assert len(calls) == 2
@@ -0,0 +1,157 @@
+"""
+Tests for Context Manager message history bookkeeping.
+
+get_messages() reuses serialized dicts and only validates the part of the
+history it hasn't seen, so every test checks its output against a fresh
+serialization of the whole history.
+"""
+
+import pytest
+
+import context.manager
+from client.response import ToolCall
+from config.config import Config
+from context.manager import NOT_PROCESSED_OUTPUT, PRUNED_OUTPUT, ContextManager
+from utils.text import estimate_tokens
+
+
+@pytest.fixture
+def manager(monkeypatch, temp_dir):
+    """Create a context manager with offline token counting."""
+    monkeypatch.setattr(context.manager, "count_tokens", lambda text, model=None: estimate_tokens(text))
+    return ContextManager(config=Config(cwd=temp_dir), user_memory=None, tools=None)
+
+
+def _tool_calls(*ids):
+    return [ToolCall(call_id=call_id, name="read_file", arguments="{}") for call_id in ids]
+
+
+def assert_matches_fresh(manager):
+    """get_messages() must equal serializing the history from scratch."""
+    assert manager.get_messages(include_system=False) == [
+        item.to_dict() for item in manager._messages
+    ]
+
+
+def test_tool_result_inserted_after_later_user_message(manager):
+    """Results inserted behind a newer user message land before it."""
+    manager.add_user_message("Read two files")
+    manager.add_assistant_message("", _tool_calls("a", "b"))
+    manager.add_tool_results([("a", "contents of a"), ("b", "contents of b")])
+    manager.add_user_message("Thanks")
+    assert_matches_fresh(manager)
+
+    manager.add_assistant_message("", _tool_calls("c"))
+    assistant_index = manager.message_count - 1
+    manager.add_user_message("Interrupted")
+    manager.add_tool_result("c", "contents of c", insert_after_assistant_index=assistant_index)
+
+    assert_matches_fresh(manager)
+    roles = [message["role"] for message in manager.get_messages(include_system=False)]
+    assert roles[-3:] == ["assistant", "tool", "user"]
+
+    # Inserting into an already validated block moves the mark back to it
+    manager.add_tool_result("b", "late contents of b", insert_after_assistant_index=1)
+    assert manager._validated_count <= 1
+    assert_matches_fresh(manager)
+
+
+def test_missing_tool_results_get_fillers(manager):
+    """Tool calls without results get a filler right after their assistant message."""
+    manager.add_user_message("Read a file")
+    manager.add_assistant_message("", _tool_calls("a", "b"))
+    manager.add_tool_result("a", "contents of a")
+    manager.add_user_message("Next")
+    assert_matches_fresh(manager)
+
+    messages = manager.get_messages(include_system=False)
+    assert [m.get("tool_call_id") for m in messages[2:4]] == ["b", "a"]
+    assert messages[2]["content"] == NOT_PROCESSED_OUTPUT
+
+    # Validated history isn't filled twice
+    manager.add_assistant_message("Done")
+    assert_matches_fresh(manager)
+    assert sum(m["content"] == NOT_PROCESSED_OUTPUT for m in manager.get_messages(include_system=False)) == 1
+
+
+def test_trailing_block_rechecked_after_more_results(manager):
+    """A tool block at the end of history is validated again once it grows."""
+    manager.add_user_message("Read files")
+    manager.add_assistant_message("", _tool_calls("a", "b"))
+    assistant_index = manager.message_count - 1
+    manager.add_tool_results([("a", "contents of a"), ("b", "contents of b")])
+    assert_matches_fresh(manager)
+    assert manager._validated_count == assistant_index
+
+    manager.add_tool_result("a", "retried a", insert_after_assistant_index=assistant_index)
+    assert_matches_fresh(manager)
+
+    manager.add_user_message("Now another")
+    manager.add_assistant_message("", _tool_calls("c"))
+    manager.add_user_message("Skipped")
+    assert_matches_fresh(manager)
+
+    messages = manager.get_messages(include_system=False)
+    assert [m["content"] for m in messages].count(NOT_PROCESSED_OUTPUT) == 1
+    assert messages[-2]["tool_call_id"] == "c"
+
+
+def test_serialized_cache_after_each_edit(manager):
+    """The serialized prefix is reset or trimmed by every kind of history edit."""
+    manager.add_user_message("Start")
+    manager.add_assistant_message("", _tool_calls("a"))
+    assistant_index = manager.message_count - 1
+    manager.add_user_message("Follow up")
+    assert_matches_fresh(manager)
+
+    # Mid-history insert
+    manager.add_tool_result("a", "contents of a", insert_after_assistant_index=assistant_index)
+    assert_matches_fresh(manager)
+
+    # Validator filler
+    manager.add_assistant_message("", _tool_calls("b"))
+    manager.add_user_message("Again")
+    assert_matches_fresh(manager)
+
+    # Summary
+    manager.replace_with_summary("Summary of the work")
+    assert_matches_fresh(manager)
+    assert manager.message_count == 3
+
+    # Clear
+    manager.clear()
+    assert_matches_fresh(manager)
+    assert manager.get_messages(include_system=False) == []
+    manager.add_user_message("Fresh start")
+    assert_matches_fresh(manager)
+
+
+def test_prune_tool_outputs_updates_serialized_results(manager):
+    """Pruned results serialize as PRUNED_OUTPUT; earlier dicts are reused."""
+    # 10k estimated tokens per result: the newest four are protected, the
+    # rest are old enough to prune
+    large_output = "x" * 40_000
+    call_ids = [f"call_{i}" for i in range(8)]
+
+    manager.add_user_message("Read everything")
+    manager.add_assistant_message("", _tool_calls(*call_ids))
+    manager.add_tool_results([(call_id, large_output) for call_id in call_ids])
+    manager.add_user_message("Continue")
+
+    before = manager.get_messages(include_system=False)
+    assert manager.prune_tool_outputs() == 4
+
+    after = manager.get_messages(include_system=False)
+    assert_matches_fresh(manager)
+    tool_contents = {m["tool_call_id"]: m["content"] for m in after if m["role"] == "tool"}
+    assert [tool_contents[call_id] for call_id in call_ids[:4]] == [PRUNED_OUTPUT] * 4
+    assert [tool_contents[call_id] for call_id in call_ids[4:]] == [large_output] * 4
+
+    # The user and assistant messages before the oldest pruned result keep
+    # their serialized dicts
+    assert after[0] is before[0]
+    assert after[1] is before[1]
+
+    # Already pruned results stop the next scan
+    assert manager.prune_tool_outputs() == 0
+    assert_matches_fresh(manager)
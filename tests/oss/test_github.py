@@ -10,9 +10,39 @@ from config.config import Config, OSSConfig
 
 import pytest
 import asyncio
+import httpx
+
+import oss.github
+
+
+@pytest.fixture
+def no_github_auth(monkeypatch):
+    """Make sure no token is found, so no request reaches the real API."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setattr(oss.github, "_gh_auth_token", lambda: None)
+
+
+@pytest.fixture
+def github_client(monkeypatch, temp_dir):
+    """
+    Create GitHub clients whose requests go to a handler instead of GitHub.
+
+    Returns a function taking the handler, with the issue cache moved to
+    temp_dir.
+    """
+    def make(handler) -> GitHubClient:
+        http_client = httpx.AsyncClient(
+            base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+        )
+        monkeypatch.setattr(oss.github, "_get_http_client", lambda: http_client)
+        monkeypatch.setattr(oss.github, "_ISSUE_CACHE", oss.github._IssueCache(temp_dir / "issues.json"))
+        return GitHubClient(Config(oss=OSSConfig(github_token="test-token")))
+
+    return make
+
 
 @pytest.mark.asyncio
-async def test_fetch_issue_error_handling():
+async def test_fetch_issue_error_handling(no_github_auth):
     """
     Test error handling of fetch_issue method.
     """
@@ -34,14 +64,14 @@ async def test_fetch_issue_error_handling():
 
 
 @pytest.mark.asyncio
-async def test_create_pr_error_handling():
+async def test_create_pr_error_handling(no_github_auth):
     """
     Test error handling of create_pr method.
     """
     config = Config(oss=OSSConfig())
     client = GitHubClient(config)
     
-    with pytest.raises(RuntimeError, match='Failed to create PR via GitHub CLI'):
+    with pytest.raises(RuntimeError, match='Failed to create PR'):
         await client.create_pr('owner', 'repo', 'title', 'body', 'head')
 
 
@@ -51,5 +81,108 @@ async def test_create_pr_error_handling():
     config = Config(oss=OSSConfig())
     client = GitHubClient(config)
     
-    with pytest.raises(RuntimeError, match='Failed to create PR via GitHub CLI'):
+    with pytest.raises(RuntimeError, match='Failed to create PR'):
         await client.create_pr('owner', 'repo', 'title', 'body', 'head')
+
+
+@pytest.mark.asyncio
+async def test_fetch_issue_via_api(github_client):
+    """
+    Test fetch_issue projects the REST API response.
+    """
+    def handler(request):
+        assert request.url.path == "/repos/owner/repo/issues/7"
+        assert request.headers["Authorization"] == "Bearer test-token"
+        return httpx.Response(200, json={
+            "title": "Crash on start",
+            "body": None,
+            "state": "open",
+            "labels": [{"name": "bug"}],
+            "number": 7,
+        })
+
+    client = github_client(handler)
+
+    issue = await client.fetch_issue("https://github.com/owner/repo/issues/7")
+    assert issue == {
+        "title": "Crash on start",
+        "body": "",
+        "state": "open",
+        "labels": ["bug"],
+        "number": 7,
+        "url": "https://github.com/owner/repo/issues/7",
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_issues_bulk_keeps_order(github_client):
+    """
+    Test fetch_issues_bulk returns issues in the order of the URLs.
+    """
+    def handler(request):
+        number = int(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, json={"title": f"Issue {number}", "number": number, "labels": []})
+
+    client = github_client(handler)
+
+    issues = await client.fetch_issues_bulk([
+        "https://github.com/owner/repo/issues/3",
+        "https://github.com/owner/repo/issues/1",
+        "https://github.com/owner/repo/issues/2",
+    ])
+    assert [issue["number"] for issue in issues] == [3, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_fetch_issue_revalidates_with_etag(github_client):
+    """
+    Test a fresh cached issue is served without a request, and a stale one
+    is reused when GitHub answers 304.
+    """
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={"title": "Cached", "number": 5, "labels": []})
+
+    client = github_client(handler)
+    url = "https://github.com/owner/repo/issues/5"
+
+    assert (await client.fetch_issue(url))["title"] == "Cached"
+    assert (await client.fetch_issue(url))["title"] == "Cached"
+    assert len(requests) == 1
+
+    oss.github._ISSUE_CACHE.set("issue:owner/repo/5", '"v1"', {"title": "Cached"}, ttl=-1)
+    assert (await client.fetch_issue(url))["title"] == "Cached"
+    assert len(requests) == 2
+    assert requests[-1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_issue_cache_writes_once_per_bulk_fetch(github_client, monkeypatch, temp_dir):
+    """
+    Test a bulk fetch writes the cache file once, and a 304 doesn't rewrite it.
+    """
+    def handler(request):
+        if request.headers.get("If-None-Match"):
+            return httpx.Response(304)
+        number = int(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, headers={"ETag": f'"{number}"'}, json={"title": f"Issue {number}", "number": number, "labels": []})
+
+    client = github_client(handler)
+    cache = oss.github._ISSUE_CACHE
+    writes = []
+    write = cache._write
+    monkeypatch.setattr(cache, "_write", lambda text, version: (writes.append(version), write(text, version)))
+    urls = [f"https://github.com/owner/repo/issues/{number}" for number in (1, 2, 3)]
+
+    await client.fetch_issues_bulk(urls)
+    assert len(writes) == 1
+    assert oss.github._IssueCache(temp_dir / "issues.json").get("issue:owner/repo/2")[2]["title"] == "Issue 2"
+    assert not list(temp_dir.glob("*.tmp"))
+
+    cache.refresh("issue:owner/repo/1", ttl=-1)
+    assert (await client.fetch_issue(urls[0]))["title"] == "Issue 1"
+    assert len(writes) == 1
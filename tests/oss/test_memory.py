@@ -32,3 +32,51 @@ def test_branch_memory_save_and_load(temp_dir):
     assert loaded is not None
     assert loaded["branch_name"] == "test-branch"
     assert loaded["issue_number"] == 123
+
+
+def test_get_current_branch(mock_git_repo):
+    """Test reading the current branch name from the repository."""
+    import subprocess
+    subprocess.run(
+        ["git", "checkout", "-b", "fix/issue-42"],
+        cwd=mock_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    manager = BranchMemoryManager(mock_git_repo)
+    assert manager.get_current_branch() == "fix/issue-42"
+
+
+def test_branch_exists_with_git_client(mock_git_repo):
+    """Test branch lookups through a persistent git process."""
+    import subprocess
+    from oss.git_client import GitClient
+
+    subprocess.run(
+        ["git", "commit", "--allow-empty", "-m", "init"],
+        cwd=mock_git_repo,
+        capture_output=True,
+        check=True,
+    )
+    subprocess.run(
+        ["git", "branch", "fix/issue-7"],
+        cwd=mock_git_repo,
+        capture_output=True,
+        check=True,
+    )
+
+    manager = BranchMemoryManager(mock_git_repo)
+    with GitClient(mock_git_repo) as git:
+        assert manager._branch_exists("fix/issue-7", git)
+        assert not manager._branch_exists("fix/issue-8", git)
+
+
+def test_find_branch_for_issue(temp_dir):
+    """Test finding the branch that holds an issue's memory."""
+    manager = BranchMemoryManager(temp_dir)
+    manager.save_branch(BranchMemoryData(branch_name="fix/issue-1", issue_number=1))
+    manager.save_branch(BranchMemoryData(branch_name="fix/issue-2", issue_number=2))
+
+    assert manager.find_branch_for_issue(2) == "fix/issue-2"
+    assert manager.find_branch_for_issue(3) is None
@@ -170,3 +170,21 @@ async def test_list_branches(temp_dir):
     branches = manager.list_branches()
     assert len(branches) == 3
     assert all(b["branch_name"].startswith("branch-") for b in branches)
+
+
+@pytest.mark.asyncio
+async def test_list_branches_with_summaries(temp_dir):
+    """Test listing branches together with their summaries."""
+    manager = BranchMemoryManager(temp_dir)
+    
+    manager.save_branch(BranchMemoryData(branch_name="branch1", issue_number=1))
+    manager.save_branch(BranchMemoryData(
+        branch_name="branch2",
+        issue_number=2,
+        context_summary="Working on parser",
+    ))
+    
+    summaries = {s["branch_name"]: s for s in manager.list_branches_with_summaries()}
+    assert set(summaries) == {"branch1", "branch2"}
+    assert summaries["branch2"]["context_summary"] == "Working on parser"
+    assert summaries["branch1"] == manager.get_branch_summary("branch1")
@@ -47,33 +47,13 @@ class ListIssuesTool(Tool):
             # Determine repository
             if not params.repo:
                 # Try to get repo from git remote
-                import subprocess
-                try:
-                    result = subprocess.run(
-                        ["git", "remote", "get-url", "origin"],
-                        cwd=repo_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    url = result.stdout.strip()
-                    if "github.com" in url:
-                        parts = url.replace(".git", "").split("github.com/")[-1].split("/")
-                        if len(parts) >= 2:
-                            owner, repo = parts[0], parts[1]
-                            repo_str = f"{owner}/{repo}"
-                        else:
-                            return ToolResult.error_result(
-                                "Could not determine repository. Please provide 'repo' parameter."
-                            )
-                    else:
-                        return ToolResult.error_result(
-                            "Not a GitHub repository. Please provide 'repo' parameter."
-                        )
-                except (subprocess.CalledProcessError, IndexError):
+                from oss.git_client import get_github_repo
+                repo_info = get_github_repo(repo_path)
+                if repo_info is None:
                     return ToolResult.error_result(
-                        "Could not determine repository. Please provide 'repo' parameter."
+                        "Could not determine GitHub repository from git remote. Please provide 'repo' parameter."
                     )
+                repo_str = f"{repo_info[0]}/{repo_info[1]}"
             else:
                 repo_str = params.repo
 
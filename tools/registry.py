@@ -16,6 +16,7 @@ class ToolRegistry:
     def __init__(self, config: Config):
         self._tools: dict[str, Tool] = {}
         self._mcp_tools: dict[str, Tool] = {}
+        self._schemas: list[dict[str, Any]] | None = None
         self.config = config
 
     @property
@@ -27,15 +28,18 @@ class ToolRegistry:
             logger.warning(f"Overwriting existing tool: {tool.name}")
 
         self._tools[tool.name] = tool
+        self._schemas = None
         logger.debug(f"Registered tool: {tool.name}")
 
     def register_mcp_tool(self, tool: Tool) -> None:
         self._mcp_tools[tool.name] = tool
+        self._schemas = None
         logger.debug(f"Registered MCP tool: {tool.name}")
 
     def unregister(self, name: str) -> bool:
         if name in self._tools:
             del self._tools[name]
+            self._schemas = None
             return True
 
         return False
@@ -66,7 +70,11 @@ class ToolRegistry:
     def get_schemas(self) -> list[dict[str, Any]]:
         # Convert tools to OpenAI-compatible schema format
         # Used for Gemini (primary, via OpenAI-compatible API) and OpenAI (fallback)
-        return [tool.to_openai_schema() for tool in self.get_tools()]
+        # The list is cached until the registry changes so every turn sends the
+        # same object (and byte-identical tool prefix) to the provider.
+        if self._schemas is None:
+            self._schemas = [tool.to_openai_schema() for tool in self.get_tools()]
+        return self._schemas
 
     async def invoke(
         self,
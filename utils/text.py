@@ -1,13 +1,20 @@
+from functools import lru_cache
+
 import tiktoken
 
 
-def get_tokenizer(model: str):
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    # Resolved once per model: models tiktoken doesn't know (e.g. Gemini)
+    # would otherwise raise and fall back on every call
     try:
-        encoding = tiktoken.encoding_for_model(model)
-        return encoding.encode
+        return tiktoken.encoding_for_model(model)
     except Exception:
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return encoding.encode
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def get_tokenizer(model: str):
+    return _get_encoding(model).encode
 
 
 def count_tokens(text: str, model: str = "gemini-2.0-flash-exp") -> int: